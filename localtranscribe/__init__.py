@@ -24,24 +24,46 @@ __version__ = "3.1.0"
 __author__ = "LocalTranscribe Contributors"
 __license__ = "MIT"
 
-# Core functionality
-from .core.diarization import run_diarization
-from .core.transcription import run_transcription
-from .core.combination import combine_results
+# Public names are resolved lazily (PEP 562) so that lightweight entry points
+# such as the CLI's --help and version commands do not pull in torch, pyannote
+# and Whisper just by importing the package.
+_LAZY_EXPORTS = {
+    # Core functionality
+    "run_diarization": ".core.diarization",
+    "run_transcription": ".core.transcription",
+    "combine_results": ".core.combination",
+    # Pipeline orchestration
+    "PipelineOrchestrator": ".pipeline.orchestrator",
+    "PipelineResult": ".pipeline.orchestrator",
+    # Configuration
+    "load_config": ".config.loader",
+    "get_config_path": ".config.loader",
+    "DEFAULT_CONFIG": ".config.defaults",
+    # Utilities
+    "LocalTranscribeError": ".utils.errors",
+    # High-level SDK
+    "LocalTranscribe": ".api.client",
+    "ProcessResult": ".api.types",
+    "BatchResult": ".api.types",
+    "Segment": ".api.types",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
 
-# Pipeline orchestration
-from .pipeline.orchestrator import PipelineOrchestrator, PipelineResult
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Configuration
-from .config.loader import load_config, get_config_path
-from .config.defaults import DEFAULT_CONFIG
 
-# Utilities
-from .utils.errors import LocalTranscribeError
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# High-level SDK
-from .api.client import LocalTranscribe
-from .api.types import ProcessResult, BatchResult, Segment
 
 __all__ = [
     # Version info
@@ -6,15 +6,11 @@ from typing import Optional, List
 from enum import Enum
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
+from ..console import get_console
 from ...utils.errors import LocalTranscribeError
 
-# Create sub-app for batch command
-app = typer.Typer()
-console = Console()
-
 
 class ModelSize(str, Enum):
     """Whisper model sizes."""
@@ -35,7 +31,6 @@ class Implementation(str, Enum):
     original = "original"
 
 
-@app.command()
 def batch(
     input_dir: Path = typer.Argument(
         ...,
@@ -143,6 +138,7 @@ def batch(
         localtranscribe batch ./audio/ -o ./transcripts/ -m small --workers 4
         localtranscribe batch ./audio/ --skip-existing --recursive
     """
+    console = get_console()
     try:
         from ...batch import BatchProcessor
 
@@ -3,17 +3,13 @@
 import sys
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-# Create sub-app for check-models command
-app = typer.Typer()
-console = Console()
+from ..console import get_console
 
 
-@app.command()
 def check_models(
     detailed: bool = typer.Option(
         False,
@@ -42,6 +38,7 @@ def check_models(
         localtranscribe check-models --detailed
         localtranscribe check-models --download en_core_web_sm
     """
+    console = get_console()
     try:
         from ...proofreading.model_manager import (
             check_dependencies,
@@ -151,6 +148,7 @@ def check_models(
 
 def _show_installed_models(installed_models: list, detailed: bool):
     """Display installed spaCy models."""
+    console = get_console()
     console.print("📚 [bold]Installed spaCy Models:[/bold]\n")
 
     if not installed_models:
@@ -188,6 +186,7 @@ def _show_installed_models(installed_models: list, detailed: bool):
 
 def _show_readiness_status(status: dict):
     """Show context-aware feature readiness."""
+    console = get_console()
     console.print()
 
     if status["context_aware_ready"]:
@@ -222,6 +221,8 @@ def _handle_download(model_name: str):
     """Handle model download request."""
     from ...proofreading.model_manager import ModelManager
 
+    console = get_console()
+
     console.print()
     console.print(f"📥 [bold]Downloading model:[/bold] [cyan]{model_name}[/cyan]\n")
 
@@ -4,13 +4,13 @@ import sys
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from ..console import get_console
+
 # Create sub-app for config command
 app = typer.Typer()
-console = Console()
 
 
 @app.command(name="show")
@@ -27,6 +27,7 @@ def config_show():
     Example:
         localtranscribe config show
     """
+    console = get_console()
     try:
         from ...config.loader import load_config, get_config_path
 
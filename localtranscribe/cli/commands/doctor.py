@@ -3,15 +3,11 @@
 import sys
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
-# Create sub-app for doctor command
-app = typer.Typer()
-console = Console()
+from ..console import get_console
 
 
-@app.command()
 def doctor(
     verbose: bool = typer.Option(
         False,
@@ -35,6 +31,7 @@ def doctor(
         localtranscribe doctor
         localtranscribe doctor -v
     """
+    console = get_console()
     try:
         from ...health.doctor import run_health_check
 
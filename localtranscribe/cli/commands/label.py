@@ -5,14 +5,10 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
 
-# Create sub-app for label command
-app = typer.Typer()
-console = Console()
+from ..console import get_console
 
 
-@app.command()
 def label(
     transcript: Path = typer.Argument(
         ...,
@@ -49,6 +45,7 @@ def label(
         localtranscribe label transcript.md --labels speakers.json
         localtranscribe label transcript.md -o custom_output.md
     """
+    console = get_console()
     try:
         from ...labels import SpeakerLabelManager
 
@@ -1,26 +1,20 @@
 """Process command - single file processing."""
 
-import sys
 from pathlib import Path
 from typing import Optional, List
 from enum import Enum
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from ...pipeline import PipelineOrchestrator, PipelineResult
+from ..console import get_console
 from ...utils.errors import (
     LocalTranscribeError,
     AudioFileNotFoundError,
     HuggingFaceTokenError,
 )
 
-# Create sub-app for process command
-app = typer.Typer()
-console = Console()
-
 
 class ModelSize(str, Enum):
     """Whisper model sizes."""
@@ -41,7 +35,6 @@ class Implementation(str, Enum):
     original = "original"
 
 
-@app.command()
 def process(
     audio_file: Path = typer.Argument(
         ...,
@@ -152,6 +145,16 @@ def process(
         "--simple",
         help="Simple mode with smart defaults and interactive prompts",
     ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Write a cProfile dump (.prof) for each pipeline stage and a stage timings JSON to the output directory",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse stage results when the same audio is processed again with the same settings",
+    ),
 ):
     """
     🎙️ Process audio file with speaker diarization and transcription.
@@ -180,6 +183,7 @@ def process(
         # Skip diarization (single speaker)
         localtranscribe process lecture.mp3 --skip-diarization
     """
+    console = get_console()
     try:
         # Set defaults
         if output_dir is None:
@@ -265,6 +269,9 @@ def process(
             console.print(config_table)
             console.print()
 
+        # Deferred: importing the pipeline pulls in the ML stack
+        from ...pipeline import PipelineOrchestrator, PipelineResult
+
         # Initialize orchestrator
         orchestrator = PipelineOrchestrator(
             audio_file=audio_file,
@@ -285,6 +292,8 @@ def process(
             enable_proofreading=proofread,
             proofreading_rules=proofread_rules,
             proofreading_level=proofread_level,
+            profile=profile,
+            use_cache=cache,
         )
 
         # Run pipeline
@@ -292,21 +301,23 @@ def process(
 
         # Handle result
         if result.success:
-            sys.exit(0)
-        else:
-            console.print(f"\n[bold red]Pipeline failed:[/bold red] {result.error}")
-            sys.exit(1)
+            raise typer.Exit(code=0)
+        console.print(f"\n[bold red]Pipeline failed:[/bold red] {result.error}")
+        raise typer.Exit(code=1)
 
+    except typer.Exit:
+        # typer.Exit derives from RuntimeError; let it through untouched
+        raise
     except (AudioFileNotFoundError, HuggingFaceTokenError) as e:
         # These errors already have formatted output
         console.print(f"\n{e}")
-        sys.exit(1)
+        raise typer.Exit(code=1) from e
     except LocalTranscribeError as e:
         console.print(f"\n{e}")
-        sys.exit(1)
+        raise typer.Exit(code=1) from e
     except KeyboardInterrupt:
         console.print("\n\n[yellow]⚠️  Process interrupted by user[/yellow]")
-        sys.exit(130)
+        raise typer.Exit(code=130) from None
     except Exception as e:
         console.print(f"\n[bold red]❌ Unexpected error:[/bold red] {e}")
         if verbose:
@@ -314,4 +325,4 @@ def process(
 
             console.print("\n[dim]Traceback:[/dim]")
             console.print(traceback.format_exc())
-        sys.exit(1)
+        raise typer.Exit(code=1) from e
@@ -3,16 +3,11 @@
 import platform
 import sys
 
-import typer
-from rich.console import Console
 from rich.table import Table
 
-# Create sub-app for version command
-app = typer.Typer()
-console = Console()
+from ..console import get_console
 
 
-@app.command()
 def version():
     """
     📦 Show LocalTranscribe version information.
@@ -20,6 +15,7 @@ def version():
     Example:
         localtranscribe version
     """
+    console = get_console()
     from ... import __version__
 
     console.print()
@@ -1,28 +1,52 @@
 """Wizard command - guided interactive setup for beginners."""
 
+import functools
+import logging
 import sys
 import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 import typer
-from rich.console import Console
+from rich.console import Group
 from rich.panel import Panel
 from rich.table import Table
-from rich.markdown import Markdown
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
 
-from ...pipeline import PipelineOrchestrator, PipelineResult
+from ..console import get_console
 from ...utils.errors import LocalTranscribeError
 
-# Create sub-app for wizard command
-app = typer.Typer()
-console = Console()
+logger = logging.getLogger(__name__)
+
+
+# Rough processing-time multipliers per model on M1/M2 Macs
+_MODEL_TIME_MULTIPLIERS: Dict[str, float] = {
+    "tiny": 0.05,
+    "base": 0.2,
+    "small": 0.5,
+    "medium": 1.0,
+    "large": 2.0,
+}
+
+# Numbered menu choices used by the wizard prompts
+_QUALITY_CHOICES: Dict[int, str] = {1: "quick", 2: "balanced", 3: "quality"}
+_PROOFREADING_LEVEL_CHOICES: Dict[int, str] = {1: "minimal", 2: "standard", 3: "thorough"}
+
+# Files smaller than this are analysed without a progress spinner
+_SPINNER_MIN_BYTES = 200 * 1024 * 1024
+
+
+def _print_block(*lines) -> None:
+    """Render several markup lines (or renderables) with a single console write."""
+    get_console().print(Group(*(Text.from_markup(line) if isinstance(line, str) else line for line in lines)))
 
 
 def welcome_screen():
     """Display welcome screen with overview."""
-    console.clear()
+    console = get_console()
+    # Clearing only makes sense on an interactive terminal
+    if console.is_terminal:
+        console.clear()
     console.print()
     console.print(
         Panel.fit(
@@ -40,10 +64,40 @@ def welcome_screen():
     console.print()
 
 
-def analyze_audio_file(audio_file: Path) -> Dict[str, Any]:
-    """Analyze audio file and provide recommendations."""
+@functools.lru_cache(maxsize=128)
+def _ffprobe_duration(path_str: str, size: int, mtime_ns: int) -> Optional[float]:
+    """
+    Probe an audio file's duration with ffprobe.
+
+    ``size`` and ``mtime_ns`` are unused by the body; they are part of the
+    cache key so that a modified file is probed again.
+    """
     import subprocess
 
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-hide_banner", "-v", "error",
+             "-probesize", "500K", "-analyzeduration", "500K",
+             "-show_entries", "format=duration",
+             "-of", "default=noprint_wrappers=1:nokey=1", path_str],
+            capture_output=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=2,
+            check=False,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return float(result.stdout.strip())
+    except subprocess.TimeoutExpired:
+        logger.debug("ffprobe timed out reading %s; duration unknown", path_str)
+    except (FileNotFoundError, ValueError):
+        pass
+
+    return None
+
+
+def analyze_audio_file(audio_file: Path) -> Dict[str, Any]:
+    """Analyze audio file and provide recommendations."""
     info = {
         "exists": audio_file.exists(),
         "size_mb": 0,
@@ -52,24 +106,16 @@ def analyze_audio_file(audio_file: Path) -> Dict[str, Any]:
     }
 
     if info["exists"]:
+        st = audio_file.stat()
+
         # Get file size
-        info["size_mb"] = audio_file.stat().st_size / (1024 * 1024)
+        info["size_mb"] = st.st_size / (1024 * 1024)
 
         # Try to get duration using ffprobe if available
-        try:
-            result = subprocess.run(
-                ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-                 "-of", "default=noprint_wrappers=1:nokey=1", str(audio_file)],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                duration_seconds = float(result.stdout.strip())
-                info["duration"] = duration_seconds
-                info["duration_minutes"] = duration_seconds / 60
-        except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
-            pass
+        duration_seconds = _ffprobe_duration(str(audio_file), st.st_size, st.st_mtime_ns)
+        if duration_seconds is not None:
+            info["duration"] = duration_seconds
+            info["duration_minutes"] = duration_seconds / 60
 
     return info
 
@@ -95,16 +141,7 @@ def estimate_processing_time(duration_minutes: Optional[float], model: str) -> s
     if duration_minutes is None:
         return "Unknown"
 
-    # Rough estimates for M1/M2 Mac (adjust multipliers based on model)
-    multipliers = {
-        "tiny": 0.05,
-        "base": 0.2,
-        "small": 0.5,
-        "medium": 1.0,
-        "large": 2.0
-    }
-
-    multiplier = multipliers.get(model, 0.2)
+    multiplier = _MODEL_TIME_MULTIPLIERS.get(model, 0.2)
     estimated_minutes = duration_minutes * multiplier
 
     if estimated_minutes < 1:
@@ -115,13 +152,53 @@ def estimate_processing_time(duration_minutes: Optional[float], model: str) -> s
         return f"~{int(estimated_minutes / 60)} hours {int(estimated_minutes % 60)} minutes"
 
 
-@app.command()
+def _read_env_var(key: str, path: Path = Path(".env")) -> Optional[str]:
+    """Look up a single ``key=value`` entry in a .env file without loading the whole file into os.environ."""
+    prefix = f"{key}="
+    try:
+        for line in path.read_text().splitlines():
+            if line.startswith(prefix):
+                return line[len(prefix):].strip().strip("'\"") or None
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def _upsert_env(path: Path, key: str, value: str, cached_content: Optional[str] = None) -> None:
+    """
+    Set ``key=value`` in a .env file, replacing an existing entry or appending one.
+
+    If ``cached_content`` is given it is used as the current file content
+    instead of reading ``path`` again.
+    """
+    if cached_content is None:
+        cached_content = path.read_text() if path.exists() else ""
+    lines = cached_content.splitlines()
+    prefix = f"{key}="
+
+    for i, line in enumerate(lines):
+        if line.startswith(prefix):
+            lines[i] = f"{prefix}{value}"
+            break
+    else:
+        lines.append(f"{prefix}{value}")
+
+    # Normalise to exactly one trailing newline
+    path.write_text("\n".join(lines).rstrip("\n") + "\n")
+
+
 def wizard(
     audio_file: Path = typer.Argument(
         ...,
         help="Path to audio file to process",
         exists=True,
     ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Accept all defaults without prompting (for scripted runs)",
+    ),
 ):
     """
     🧙‍♂️ Guided wizard for easy transcription setup.
@@ -129,29 +206,45 @@ def wizard(
     Perfect for first-time users! This interactive wizard will guide you
     through all the options and help you get the best results.
 
-    Example:
+    Examples:
         localtranscribe wizard interview.mp3
+
+        # Accept every default and start immediately
+        localtranscribe wizard interview.mp3 --yes
     """
+    console = get_console()
+
+    def confirm(message: str, default: bool) -> bool:
+        return default if yes else typer.confirm(message, default=default)
+
+    def prompt_choice(message: str, default: int) -> int:
+        return default if yes else typer.prompt(message, type=int, default=default, show_default=True)
+
     try:
         welcome_screen()
 
-        if not typer.confirm("Ready to get started?", default=True):
+        if not confirm("Ready to get started?", default=True):
             console.print("[yellow]Wizard cancelled. Run 'localtranscribe wizard <audio-file>' when ready![/yellow]")
             sys.exit(0)
 
         # Step 1: Analyze audio file
-        console.print()
-        console.print("[bold]Step 1: Analyzing your audio file...[/bold]")
-        console.print()
+        _print_block("", "[bold]Step 1: Analyzing your audio file...[/bold]", "")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Analyzing...", total=None)
+        # ffprobe returns near-instantly on typical files; only show a spinner
+        # on a terminal and when the file is large enough for the probe to be noticeable
+        if not console.is_terminal or audio_file.stat().st_size < _SPINNER_MIN_BYTES:
             audio_info = analyze_audio_file(audio_file)
-            progress.update(task, completed=True)
+        else:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            ) as progress:
+                task = progress.add_task("Analyzing...", total=None)
+                audio_info = analyze_audio_file(audio_file)
+                progress.update(task, completed=True)
 
         # Display audio info
         info_table = Table(show_header=False, box=None)
@@ -164,36 +257,32 @@ def wizard(
         if audio_info['duration']:
             info_table.add_row("⏱️  Duration", f"{audio_info['duration_minutes']:.1f} minutes")
 
-        console.print(info_table)
-        console.print()
-
         # Step 2: Quality preference
-        console.print("[bold]Step 2: Choose your quality vs. speed preference:[/bold]")
-        console.print()
-        console.print("  [cyan]1. Quick[/cyan] - Fastest processing (tiny model)")
-        console.print("  [cyan]2. Balanced[/cyan] - Good quality and speed (medium model) [dim][recommended][/dim]")
-        console.print("  [cyan]3. High Quality[/cyan] - Best accuracy, slower (large model)")
-        console.print()
-
-        quality_choice = typer.prompt(
-            "Your choice",
-            type=int,
-            default=2,
-            show_default=True
+        _print_block(
+            info_table,
+            "",
+            "[bold]Step 2: Choose your quality vs. speed preference:[/bold]",
+            "",
+            "  [cyan]1. Quick[/cyan] - Fastest processing (tiny model)",
+            "  [cyan]2. Balanced[/cyan] - Good quality and speed (medium model) [dim][recommended][/dim]",
+            "  [cyan]3. High Quality[/cyan] - Best accuracy, slower (large model)",
+            "",
         )
 
-        quality_map = {1: "quick", 2: "balanced", 3: "quality"}
-        quality_preference = quality_map.get(quality_choice, "balanced")
-        model_size = recommend_model(audio_info.get('duration_minutes'), quality_preference)
+        quality_choice = prompt_choice("Your choice", default=2)
 
-        console.print(f"[green]✓ Using '{model_size}' model[/green]")
-        console.print()
+        quality_preference = _QUALITY_CHOICES.get(quality_choice, "balanced")
+        model_size = recommend_model(audio_info.get('duration_minutes'), quality_preference)
 
         # Step 3: Speakers
-        console.print("[bold]Step 3: Tell me about the speakers:[/bold]")
-        console.print()
+        _print_block(
+            f"[green]✓ Using '{model_size}' model[/green]",
+            "",
+            "[bold]Step 3: Tell me about the speakers:[/bold]",
+            "",
+        )
 
-        know_speaker_count = typer.confirm("Do you know exactly how many speakers?", default=False)
+        know_speaker_count = confirm("Do you know exactly how many speakers?", default=False)
         num_speakers = None
 
         if know_speaker_count:
@@ -202,16 +291,17 @@ def wizard(
         else:
             console.print("[dim]No problem! I'll automatically detect the number of speakers.[/dim]")
 
-        console.print()
-
         # Step 4: Speaker labels
-        console.print("[bold]Step 4: Speaker names (optional):[/bold]")
-        console.print()
-        console.print("Do you want to label speakers with their actual names?")
-        console.print("[dim](e.g., replace 'SPEAKER_00' with 'John Smith')[/dim]")
-        console.print()
+        _print_block(
+            "",
+            "[bold]Step 4: Speaker names (optional):[/bold]",
+            "",
+            "Do you want to label speakers with their actual names?",
+            "[dim](e.g., replace 'SPEAKER_00' with 'John Smith')[/dim]",
+            "",
+        )
 
-        use_labels = typer.confirm("Yes, I want to add speaker names", default=True)
+        use_labels = confirm("Yes, I want to add speaker names", default=True)
         labels_file = None
         save_labels = None
 
@@ -220,17 +310,19 @@ def wizard(
             auto_labels = audio_file.parent / "speaker_labels.json"
             if auto_labels.exists():
                 console.print(f"[cyan]✓ Found existing labels file: {auto_labels.name}[/cyan]")
-                if typer.confirm("Use this file?", default=True):
+                if confirm("Use this file?", default=True):
                     labels_file = auto_labels
 
             if labels_file is None:
-                console.print()
-                console.print("You can either:")
-                console.print("  1. Provide labels now (I'll save them for you)")
-                console.print("  2. Skip for now (you can add them later)")
-                console.print()
+                _print_block(
+                    "",
+                    "You can either:",
+                    "  1. Provide labels now (I'll save them for you)",
+                    "  2. Skip for now (you can add them later)",
+                    "",
+                )
 
-                if typer.confirm("Would you like to provide a labels file?", default=False):
+                if confirm("Would you like to provide a labels file?", default=False):
                     labels_path = typer.prompt("Path to labels JSON file")
                     labels_file = Path(labels_path)
 
@@ -242,43 +334,42 @@ def wizard(
                     save_labels = audio_file.parent / "speaker_labels.json"
                     console.print(f"[dim]I'll save speaker IDs to {save_labels.name} for you to edit later.[/dim]")
 
-        console.print()
-
         # Step 5: Proofreading
-        console.print("[bold]Step 5: Automatic proofreading:[/bold]")
-        console.print()
-        console.print("I can automatically fix common transcription errors like:")
-        console.print("  • Technical terms (API → API, JavaScript → JavaScript)")
-        console.print("  • Homophones (your/you're, their/there)")
-        console.print("  • Business terms (CEO, VP, B2B)")
-        console.print("  • Excessive repetitions")
-        console.print()
+        _print_block(
+            "",
+            "[bold]Step 5: Automatic proofreading:[/bold]",
+            "",
+            "I can automatically fix common transcription errors like:",
+            "  • Technical terms (API → API, JavaScript → JavaScript)",
+            "  • Homophones (your/you're, their/there)",
+            "  • Business terms (CEO, VP, B2B)",
+            "  • Excessive repetitions",
+            "",
+        )
 
-        enable_proofreading = typer.confirm("Enable automatic proofreading?", default=True)
+        enable_proofreading = confirm("Enable automatic proofreading?", default=True)
         proofreading_level = "standard"
 
         if enable_proofreading:
-            console.print()
-            console.print("Proofreading level:")
-            console.print("  [cyan]1. Minimal[/cyan] - Only the most common fixes")
-            console.print("  [cyan]2. Standard[/cyan] - Comprehensive corrections [dim][recommended][/dim]")
-            console.print("  [cyan]3. Thorough[/cyan] - All available corrections")
-            console.print()
+            _print_block(
+                "",
+                "Proofreading level:",
+                "  [cyan]1. Minimal[/cyan] - Only the most common fixes",
+                "  [cyan]2. Standard[/cyan] - Comprehensive corrections [dim][recommended][/dim]",
+                "  [cyan]3. Thorough[/cyan] - All available corrections",
+                "",
+            )
 
-            level_choice = typer.prompt("Your choice", type=int, default=2, show_default=True)
-            level_map = {1: "minimal", 2: "standard", 3: "thorough"}
-            proofreading_level = level_map.get(level_choice, "standard")
+            level_choice = prompt_choice("Your choice", default=2)
+            proofreading_level = _PROOFREADING_LEVEL_CHOICES.get(level_choice, "standard")
 
             console.print(f"[green]✓ Proofreading level: {proofreading_level}[/green]")
 
-        console.print()
-
         # Step 6: Output location
-        console.print("[bold]Step 6: Where should I save the results?[/bold]")
-        console.print()
+        _print_block("", "[bold]Step 6: Where should I save the results?[/bold]", "")
 
         default_output = Path("./output")
-        custom_output = typer.confirm(
+        custom_output = confirm(
             f"Use default output directory: {default_output}?",
             default=True
         )
@@ -289,31 +380,33 @@ def wizard(
             output_path = typer.prompt("Output directory")
             output_dir = Path(output_path)
 
-        console.print(f"[green]✓ Will save to: {output_dir}[/green]")
-        console.print()
-
         # Step 7: Summary and confirmation
-        console.print()
-        console.print(Panel.fit(
-            "[bold]📋 Summary[/bold]\n\n"
-            f"[cyan]Audio File:[/cyan] {audio_file.name}\n"
-            f"[cyan]Model:[/cyan] {model_size}\n"
-            f"[cyan]Speakers:[/cyan] {num_speakers if num_speakers else 'Auto-detect'}\n"
-            f"[cyan]Speaker Labels:[/cyan] {'Yes' if labels_file or save_labels else 'No'}\n"
-            f"[cyan]Proofreading:[/cyan] {proofreading_level.title() if enable_proofreading else 'Disabled'}\n"
-            f"[cyan]Output:[/cyan] {output_dir}",
-            border_style="cyan",
-            title="Configuration"
-        ))
-        console.print()
+        summary = [
+            f"[green]✓ Will save to: {output_dir}[/green]",
+            "",
+            "",
+            Panel.fit(
+                "[bold]📋 Summary[/bold]\n\n"
+                f"[cyan]Audio File:[/cyan] {audio_file.name}\n"
+                f"[cyan]Model:[/cyan] {model_size}\n"
+                f"[cyan]Speakers:[/cyan] {num_speakers if num_speakers else 'Auto-detect'}\n"
+                f"[cyan]Speaker Labels:[/cyan] {'Yes' if labels_file or save_labels else 'No'}\n"
+                f"[cyan]Proofreading:[/cyan] {proofreading_level.title() if enable_proofreading else 'Disabled'}\n"
+                f"[cyan]Output:[/cyan] {output_dir}",
+                border_style="cyan",
+                title="Configuration"
+            ),
+            "",
+        ]
 
         # Show estimated processing time
         if audio_info.get('duration_minutes'):
             estimated_time = estimate_processing_time(audio_info['duration_minutes'], model_size)
-            console.print(f"[dim]⏱️  Estimated processing time: {estimated_time}[/dim]")
-            console.print()
+            summary += [f"[dim]⏱️  Estimated processing time: {estimated_time}[/dim]", ""]
+
+        _print_block(*summary)
 
-        if not typer.confirm("Everything looks good. Start processing?", default=True):
+        if not confirm("Everything looks good. Start processing?", default=True):
             console.print("[yellow]Processing cancelled.[/yellow]")
             sys.exit(0)
 
@@ -323,9 +416,8 @@ def wizard(
         console.print()
 
         # Check for HuggingFace token
-        from dotenv import load_dotenv
-        load_dotenv()
-        hf_token = os.getenv('HUGGINGFACE_TOKEN')
+        env_path = Path(".env")
+        hf_token = os.getenv('HUGGINGFACE_TOKEN') or _read_env_var('HUGGINGFACE_TOKEN', env_path)
 
         # Check if token is missing, placeholder, or skip reminder
         if not hf_token or hf_token == "your_token_here" or hf_token == "SKIP_REMINDER":
@@ -351,7 +443,14 @@ def wizard(
             console.print("  3. Continue without diarization (transcription only)")
             console.print()
 
-            choice = typer.prompt("Your choice", type=int, default=1, show_default=True)
+            # Read .env once; whichever branch is taken only writes it
+            env_content = env_path.read_text() if env_path.exists() else ""
+
+            if yes:
+                # Nothing to prompt for non-interactively; run transcription only
+                choice = 3
+            else:
+                choice = typer.prompt("Your choice", type=int, default=1, show_default=True)
 
             if choice == 1:
                 # Enter token with validation
@@ -378,32 +477,7 @@ def wizard(
                     hf_token = token_input
 
                     # Save to .env file
-                    env_path = Path(".env")
-
-                    # Read existing .env content
-                    env_content = ""
-                    if env_path.exists():
-                        with open(env_path, "r") as f:
-                            env_content = f.read()
-
-                    # Replace or add token
-                    if "HUGGINGFACE_TOKEN=" in env_content:
-                        # Replace existing token (including SKIP_REMINDER)
-                        import re
-                        env_content = re.sub(
-                            r'HUGGINGFACE_TOKEN=.*',
-                            f'HUGGINGFACE_TOKEN={hf_token}',
-                            env_content
-                        )
-                    else:
-                        # Add new token
-                        if env_content and not env_content.endswith('\n'):
-                            env_content += '\n'
-                        env_content += f'HUGGINGFACE_TOKEN={hf_token}\n'
-
-                    # Write back
-                    with open(env_path, "w") as f:
-                        f.write(env_content)
+                    _upsert_env(env_path, "HUGGINGFACE_TOKEN", hf_token, cached_content=env_content)
 
                     console.print(f"[green]✓ Token saved to {env_path}[/green]")
                     console.print("[dim]You won't be asked again on future runs.[/dim]")
@@ -412,29 +486,7 @@ def wizard(
 
             elif choice == 2:
                 # Skip for now - save reminder
-                env_path = Path(".env")
-
-                # Read existing .env content
-                env_content = ""
-                if env_path.exists():
-                    with open(env_path, "r") as f:
-                        env_content = f.read()
-
-                # Replace or add SKIP_REMINDER
-                if "HUGGINGFACE_TOKEN=" in env_content:
-                    import re
-                    env_content = re.sub(
-                        r'HUGGINGFACE_TOKEN=.*',
-                        'HUGGINGFACE_TOKEN=SKIP_REMINDER',
-                        env_content
-                    )
-                else:
-                    if env_content and not env_content.endswith('\n'):
-                        env_content += '\n'
-                    env_content += 'HUGGINGFACE_TOKEN=SKIP_REMINDER\n'
-
-                with open(env_path, "w") as f:
-                    f.write(env_content)
+                _upsert_env(env_path, "HUGGINGFACE_TOKEN", "SKIP_REMINDER", cached_content=env_content)
 
                 console.print("[yellow]⚠️  Token setup skipped. I'll remind you next time.[/yellow]")
                 console.print("[yellow]⚠️  Speaker diarization will be disabled for this run.[/yellow]")
@@ -447,6 +499,9 @@ def wizard(
                 console.print()
                 hf_token = None
 
+        # Deferred: importing the pipeline pulls in the ML stack
+        from ...pipeline import PipelineOrchestrator, PipelineResult
+
         # Initialize and run the orchestrator
         orchestrator = PipelineOrchestrator(
             audio_file=audio_file,
@@ -454,6 +509,8 @@ def wizard(
             model_size=model_size,
             num_speakers=num_speakers,
             hf_token=hf_token,
+            # No token means transcription only (choices 2 and 3, or --yes)
+            skip_diarization=hf_token is None,
             verbose=True,  # Always verbose in wizard
             labels_file=labels_file,
             save_labels=save_labels,
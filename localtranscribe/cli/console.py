@@ -0,0 +1,11 @@
+"""Shared console for CLI commands."""
+
+import functools
+
+from rich.console import Console
+
+
+@functools.lru_cache(maxsize=1)
+def get_console() -> Console:
+    """Create the CLI console on first use (not at import, e.g. for --help)."""
+    return Console()
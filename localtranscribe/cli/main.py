@@ -27,12 +27,11 @@ if not hasattr(sys, '_localtranscribe_warnings_configured'):
         sys._localtranscribe_warnings_configured = True
 
 # Now import everything else
-from pathlib import Path
+import os.path
+
 import typer
-from rich.console import Console
 
 from . import commands
-from .. import __version__
 from ..utils.file_browser import prompt_for_file
 
 # Initialize main app
@@ -43,7 +42,6 @@ app = typer.Typer(
          "💡 Or run 'localtranscribe' without arguments to browse files interactively!",
     add_completion=False,
 )
-console = Console()
 
 # Add commands
 app.command(name="wizard")(commands.wizard.wizard)
@@ -55,17 +53,23 @@ app.command(name="label")(commands.label.label)
 app.command(name="version")(commands.version.version)
 app.command(name="check-models")(commands.check_models.check_models)
 
+# Subcommands and flags handled by typer directly (never routed to the wizard)
+_KNOWN_COMMANDS = frozenset({
+    'wizard', 'process', 'batch', 'doctor', 'config', 'label', 'version', 'check-models',
+    '--help', '-h'
+})
 
-def is_audio_file(path_str: str) -> bool:
-    """Check if the argument looks like an audio file."""
-    # Audio extensions we support
-    audio_extensions = {
-        '.mp3', '.wav', '.ogg', '.m4a', '.flac', '.aac', '.wma', '.opus',
-        '.mp4', '.mov', '.avi', '.mkv', '.webm'  # Video files (extract audio)
-    }
+# Audio extensions we support
+_AUDIO_EXTS = frozenset({
+    '.mp3', '.wav', '.ogg', '.m4a', '.flac', '.aac', '.wma', '.opus',
+    '.mp4', '.mov', '.avi', '.mkv', '.webm'  # Video files (extract audio)
+})
 
-    path = Path(path_str)
-    return path.suffix.lower() in audio_extensions or path.exists()
+
+def is_audio_file(path_str: str) -> bool:
+    """Check if the argument looks like an audio file (by extension only)."""
+    # No stat here: the wizard's `exists=True` argument reports missing files
+    return os.path.splitext(path_str)[1].lower() in _AUDIO_EXTS
 
 
 def main():
@@ -77,7 +81,7 @@ def main():
             # User selected a file - route to wizard
             sys.argv.append('wizard')
             sys.argv.append(str(selected_file))
-            console.print("[dim]💡 Running guided wizard (use 'localtranscribe process' for direct mode)[/dim]\n")
+            print("💡 Running guided wizard (use 'localtranscribe process' for direct mode)\n")
         else:
             # User cancelled - exit gracefully
             return
@@ -88,14 +92,12 @@ def main():
         first_arg = sys.argv[1]
 
         # If first argument is not a known command and looks like a file, route to wizard
-        known_commands = {'wizard', 'process', 'batch', 'doctor', 'config', 'label', 'version', 'check-models', '--help', '-h'}
-
-        if first_arg not in known_commands and not first_arg.startswith('-'):
+        if first_arg not in _KNOWN_COMMANDS and not first_arg.startswith('-'):
             # Check if it looks like an audio file
             if is_audio_file(first_arg):
                 # Route to wizard by inserting 'wizard' command
                 sys.argv.insert(1, 'wizard')
-                console.print("[dim]💡 Running guided wizard (use 'localtranscribe process' for direct mode)[/dim]\n")
+                print("💡 Running guided wizard (use 'localtranscribe process' for direct mode)\n")
 
     app()
 
@@ -5,10 +5,30 @@ These defaults can be overridden by user configuration files.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Literal, Mapping, overload
 
-# Default configuration
-DEFAULT_CONFIG: Dict[str, Any] = {
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze(): build plain, independently mutable dicts and lists."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Default configuration (read-only; use get_default_config() for a copy)
+DEFAULT_CONFIG: Mapping[str, Any] = _freeze({
     # Model settings
     "model": {
         "whisper_size": "base",  # tiny, base, small, medium, large
@@ -29,7 +49,9 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "min_segment_duration": 0.3,  # Min duration (seconds) for a segment
         "merge_gap_threshold": 1.0,  # Max gap (seconds) to merge same-speaker segments
         "min_speaker_turn": 2.0,  # Min duration (seconds) for speaker turn
+        "min_region_duration": 0.0,  # Fold shorter speaker regions into a neighbour (0 = off)
         "smoothing_window": 2.0,  # Time window (seconds) for temporal smoothing
+        "lazy_stats": False,  # Compute processing stats only when first read
     },
     # Speaker mapping settings (Phase 1 enhancement)
     "speaker_mapping": {
@@ -98,19 +120,46 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "log_file": None,  # None = no log file
         "log_level": "INFO",  # DEBUG, INFO, WARNING, ERROR
     },
-}
+})
+
+
+@overload
+def get_default_config(mutable: Literal[True] = ..., deep: bool = ...) -> dict[str, Any]: ...
 
 
-def get_default_config() -> Dict[str, Any]:
+@overload
+def get_default_config(mutable: Literal[False], deep: bool = ...) -> Mapping[str, Any]: ...
+
+
+@overload
+def get_default_config(mutable: bool, deep: bool = ...) -> Mapping[str, Any]: ...
+
+
+def get_default_config(mutable: bool = True, deep: bool = True) -> Mapping[str, Any]:
     """
-    Get a copy of the default configuration.
+    Get the default configuration.
+
+    Args:
+        mutable: Return a private copy that the caller may modify. Pass
+            False for the shared read-only DEFAULT_CONFIG, with no copying.
+        deep: Copy every level. With False only the top-level sections are
+            copied, which is enough to override their values; anything
+            nested deeper stays read-only.
 
     Returns:
-        Dictionary with default configuration values
+        Dictionary (or read-only mapping) with default configuration values
     """
-    import copy
+    if not mutable:
+        return DEFAULT_CONFIG
+
+    if deep:
+        config: dict[str, Any] = _thaw(DEFAULT_CONFIG)
+        return config
 
-    return copy.deepcopy(DEFAULT_CONFIG)
+    return {
+        key: dict(section) if isinstance(section, Mapping) else section
+        for key, section in DEFAULT_CONFIG.items()
+    }
 
 
 def get_config_search_paths() -> list[Path]:
@@ -4,6 +4,8 @@ Configuration loader for LocalTranscribe.
 Handles loading configuration from files and environment variables.
 """
 
+import copy
+import functools
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -43,9 +45,22 @@ def load_yaml_config(config_path: Path) -> Dict[str, Any]:
             "Install with: pip install pyyaml"
         )
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    # Hand out a copy so callers can't mutate the cached parse
+    return copy.deepcopy(_load_config_cached(config_path, mtime_ns))
 
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, memoized on its path and modification time.
+
+    Editing the file bumps its mtime, so a stale parse is never returned.
+    """
     with open(config_path, "r", encoding="utf-8") as f:
         config = yaml.safe_load(f)
 
@@ -65,8 +80,6 @@ def merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, A
     Returns:
         Merged configuration dictionary
     """
-    import copy
-
     result = copy.deepcopy(base)
 
     for key, value in override.items():
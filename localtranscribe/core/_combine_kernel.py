@@ -0,0 +1,152 @@
+"""
+Compiled speaker-scoring kernel for the combination stage.
+
+Optional acceleration for ``map_speakers_to_segments``: when numba is
+installed the per-segment scoring loop is JIT-compiled to machine code.
+The results match the NumPy implementation in ``combination.py`` exactly.
+"""
+
+from typing import Any, Callable
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _score_segments(
+    trans_starts,
+    trans_ends,
+    region_starts,
+    region_ends,
+    duration_scores,
+    region_confidences,
+    region_speaker_ids,
+    windowed,
+    overlap_weight,
+    duration_weight,
+    temporal_consistency_weight,
+):
+    """
+    Choose the best region for each transcription segment.
+
+    Args:
+        trans_starts, trans_ends: Transcription segment bounds (float64)
+        region_starts, region_ends: Speaker region bounds (float64)
+        duration_scores: Precomputed per-region duration score (float64)
+        region_confidences: Per-region confidence multiplier (float64)
+        region_speaker_ids: Integer speaker id per region (int64)
+        windowed: True if region starts are sorted, enabling binary search
+        overlap_weight, duration_weight, temporal_consistency_weight: Score weights
+
+    Returns:
+        Tuple of (best region index, speaker confidence) arrays, one entry per
+        transcription segment. Requires at least one region.
+    """
+    num_segments = trans_starts.shape[0]
+    num_regions = region_starts.shape[0]
+
+    best_regions = np.zeros(num_segments, dtype=np.int64)
+    best_confidences = np.zeros(num_segments, dtype=np.float64)
+
+    # Running max of region ends (ends are not monotonic when speech overlaps),
+    # and the first region holding each running max
+    max_ends = np.empty(num_regions, dtype=np.float64)
+    latest_end_index = np.empty(num_regions, dtype=np.int64)
+    running_end = -np.inf
+    running_index = 0
+    bounded = True
+    for j in range(num_regions):
+        if j == 0 or region_ends[j] > running_end:
+            running_end = region_ends[j]
+            running_index = j
+        max_ends[j] = running_end
+        latest_end_index[j] = running_index
+        if not region_ends[j] >= region_starts[j]:
+            bounded = False
+
+    previous_speaker = -1
+
+    for t in range(num_segments):
+        trans_start = trans_starts[t]
+        trans_end = trans_ends[t]
+        trans_duration = trans_end - trans_start
+
+        if windowed:
+            lo = np.searchsorted(max_ends, trans_start, side='right')
+            hi = np.searchsorted(region_starts, trans_end, side='left')
+        else:
+            lo = 0
+            hi = num_regions
+
+        best = -1
+        best_score = -np.inf
+        best_confidence = 0.0
+
+        for j in range(lo, hi):
+            overlap_duration = min(trans_end, region_ends[j]) - max(trans_start, region_starts[j])
+            if overlap_duration <= 0:
+                continue
+
+            overlap_score = overlap_duration / trans_duration
+            consistency_score = 0.8 if region_speaker_ids[j] == previous_speaker else 0.2
+
+            score = (
+                overlap_score * overlap_weight
+                + duration_scores[j] * duration_weight
+                + consistency_score * temporal_consistency_weight
+            ) * region_confidences[j]
+
+            if score > best_score:
+                best_score = score
+                best = j
+                best_confidence = overlap_score
+
+        if best < 0 and windowed and bounded and trans_end >= trans_start:
+            # No overlap: nearest region by boundary distance. Before the window
+            # the latest-ending region is nearest, after it the first region.
+            min_distance = np.inf
+            if lo > 0:
+                best = latest_end_index[lo - 1]
+                min_distance = trans_start - region_ends[best]
+            for j in range(lo, hi):
+                distance = min(
+                    min(abs(trans_start - region_ends[j]), abs(trans_end - region_starts[j])),
+                    min(abs(trans_start - region_starts[j]), abs(trans_end - region_ends[j])),
+                )
+                if distance < min_distance:
+                    min_distance = distance
+                    best = j
+            if hi < num_regions and region_starts[hi] - trans_end < min_distance:
+                best = hi
+            best_confidence = 0.1
+        elif best < 0:
+            # No overlap: nearest region by boundary distance
+            min_distance = np.inf
+            for j in range(num_regions):
+                distance = min(
+                    min(abs(trans_start - region_ends[j]), abs(trans_end - region_starts[j])),
+                    min(abs(trans_start - region_starts[j]), abs(trans_end - region_ends[j])),
+                )
+                if distance < min_distance:
+                    min_distance = distance
+                    best = j
+            best_confidence = 0.1
+            if best < 0:  # Only reachable with NaN bounds
+                best = 0
+
+        best_regions[t] = best
+        best_confidences[t] = best_confidence
+        previous_speaker = region_speaker_ids[best]
+
+    return best_regions, best_confidences
+
+
+# Without numba the kernel still runs as plain Python, but far slower than
+# the NumPy implementation, which callers use instead
+score_segments: Callable[..., Any] = (
+    njit(cache=True)(_score_segments) if NUMBA_AVAILABLE else _score_segments
+)
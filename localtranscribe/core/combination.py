@@ -4,21 +4,73 @@ Combine speaker diarization and transcription results.
 Maps speakers to transcription segments and creates speaker-labeled transcripts.
 """
 
+import bisect
+import functools
+import io
 import json
+import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-import datetime
+from datetime import datetime as _dt
+
+import numpy as np
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..utils.errors import CombinationError
+from ._combine_kernel import NUMBA_AVAILABLE, score_segments
 from .transcription import TranscriptionSegment
 from .diarization import DiarizationResult
 from .transcription import TranscriptionResult
 
 
-@dataclass
+# Segment table in a diarization markdown file: the section heading, the
+# table header up to its |--- separator, then the body (group 1), which runs
+# until the first non-blank line that is not a table row
+_DIARIZATION_TABLE_RE = re.compile(
+    r'^.*(?:Speaker Segments|Regular Speaker Diarization).*\n'
+    r'(?:(?:\|.*|[ \t\r]*)\n)*?'
+    r'\|---.*(?:\n|\Z)'
+    r'((?:(?:\|.*|[ \t\r]*)(?:\n|\Z))*)',
+    re.MULTILINE,
+)
+
+# One table row: speaker, start, end and duration cells
+_DIARIZATION_ROW_RE = re.compile(
+    r'^\|[ \t]*([^|\n]+?)[ \t]*\|[ \t]*([^|\n]+?)[ \t]*\|'
+    r'[ \t]*([^|\n]+?)[ \t]*\|[ \t]*([^|\n]+?)[ \t]*(?:\||$)',
+    re.MULTILINE,
+)
+
+# A sentence with its trailing punctuation and whitespace (the last one may
+# have neither)
+_SENTENCE_RE = re.compile(r'.*?(?:[.!?]+\s+|\Z)', re.DOTALL)
+
+# orjson parses large transcription files several times faster when installed
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Buffer size for streamed transcript writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# __slots__ for the per-segment dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class EnhancedSegment:
-    """Transcription segment enhanced with speaker information."""
+    """Transcription segment enhanced with speaker information.
+
+    ``text`` is stored stripped of surrounding whitespace.
+    """
 
     start: float
     end: float
@@ -46,7 +98,7 @@ class CombinationResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SpeakerRegion:
     """Represents a contiguous region dominated by one speaker.
 
@@ -64,7 +116,7 @@ class SpeakerRegion:
 
 
 def create_speaker_regions(
-    diarization_segments: List[Dict[str, Any]], max_gap: float = 1.0
+    diarization_segments: List[Dict[str, Any]], max_gap: float = 1.0, min_region_duration: float = 0.0
 ) -> List[SpeakerRegion]:
     """Create speaker regions from diarization segments.
 
@@ -74,6 +126,8 @@ def create_speaker_regions(
     Args:
         diarization_segments: List of diarization segments
         max_gap: Maximum gap (seconds) to bridge between same-speaker segments
+        min_region_duration: Regions shorter than this (seconds) are folded into
+            the longer of their neighbours (0 disables folding)
 
     Returns:
         List of speaker regions
@@ -81,7 +135,7 @@ def create_speaker_regions(
     if not diarization_segments:
         return []
 
-    regions = []
+    spans = []
     current_region = {
         'speaker': diarization_segments[0]['speaker'],
         'start': diarization_segments[0]['start'],
@@ -99,19 +153,7 @@ def create_speaker_regions(
             current_region['segment_count'] += 1
         else:
             # Save current region and start new one
-            duration = current_region['end'] - current_region['start']
-            regions.append(
-                SpeakerRegion(
-                    speaker=current_region['speaker'],
-                    start=current_region['start'],
-                    end=current_region['end'],
-                    duration=duration,
-                    confidence=current_region['confidence'],
-                    segment_count=current_region['segment_count'],
-                )
-            )
-
-            # Start new region
+            spans.append(current_region)
             current_region = {
                 'speaker': seg['speaker'],
                 'start': seg['start'],
@@ -121,19 +163,81 @@ def create_speaker_regions(
             }
 
     # Don't forget the last region
-    duration = current_region['end'] - current_region['start']
-    regions.append(
+    spans.append(current_region)
+
+    if min_region_duration > 0 and len(spans) > 1:
+        spans = _fold_short_regions(spans, min_region_duration, max_gap)
+
+    return [
         SpeakerRegion(
-            speaker=current_region['speaker'],
-            start=current_region['start'],
-            end=current_region['end'],
-            duration=duration,
-            confidence=current_region['confidence'],
-            segment_count=current_region['segment_count'],
+            speaker=span['speaker'],
+            start=span['start'],
+            end=span['end'],
+            duration=span['end'] - span['start'],
+            confidence=span['confidence'],
+            segment_count=span['segment_count'],
         )
-    )
+        for span in spans
+    ]
+
+
+def _fold_short_regions(
+    spans: List[Dict[str, Any]], min_region_duration: float, max_gap: float
+) -> List[Dict[str, Any]]:
+    """Absorb regions shorter than min_region_duration into a neighbour.
+
+    Each short region is swallowed by whichever adjacent region within max_gap
+    is longer; isolated short regions are kept. Same-speaker regions that end
+    up next to each other within max_gap are merged again, so an A-B-A blip
+    collapses into a single A region.
+
+    Args:
+        spans: Region dicts in time order, as built by create_speaker_regions
+        min_region_duration: Minimum region duration (seconds) to keep
+        max_gap: Maximum gap (seconds) to bridge between same-speaker regions
+
+    Returns:
+        The folded region dicts
+    """
+    folded: List[Dict[str, Any]] = []
+    last = len(spans) - 1
+
+    for i, span in enumerate(spans):
+        previous = folded[-1] if folded else None
+
+        if span['end'] - span['start'] < min_region_duration:
+            # Only neighbours within max_gap can absorb it; stretching a region
+            # across a longer silence would misplace the speaker
+            before = previous
+            if before is not None and span['start'] - before['end'] > max_gap:
+                before = None
+            after = spans[i + 1] if i < last else None
+            if after is not None and after['start'] - span['end'] > max_gap:
+                after = None
+
+            if before is not None and (
+                after is None or before['end'] - before['start'] >= after['end'] - after['start']
+            ):
+                before['end'] = max(before['end'], span['end'])
+                before['segment_count'] += span['segment_count']
+                continue
+            if after is not None:
+                after['start'] = min(after['start'], span['start'])
+                after['segment_count'] += span['segment_count']
+                continue
+
+        if (
+            previous is not None
+            and previous['speaker'] == span['speaker']
+            and span['start'] - previous['end'] <= max_gap
+        ):
+            previous['end'] = max(previous['end'], span['end'])
+            previous['segment_count'] += span['segment_count']
+            continue
+
+        folded.append(span)
 
-    return regions
+    return folded
 
 
 def map_speakers_to_segments(
@@ -143,6 +247,7 @@ def map_speakers_to_segments(
     temporal_consistency_weight: float = 0.3,
     duration_weight: float = 0.4,
     overlap_weight: float = 0.3,
+    min_region_duration: float = 0.0,
 ) -> List[EnhancedSegment]:
     """
     Map speakers to transcription segments using context-aware scoring.
@@ -157,13 +262,17 @@ def map_speakers_to_segments(
         temporal_consistency_weight: Weight for temporal consistency score
         duration_weight: Weight for region duration score
         overlap_weight: Weight for overlap score
+        min_region_duration: Fold speaker regions shorter than this (seconds)
+            into a neighbouring region; only used with ``use_regions``
 
     Returns:
         List of enhanced segments with speaker labels and confidence scores
     """
     # Create speaker regions for better context
     if use_regions:
-        regions = create_speaker_regions(diarization_segments, max_gap=1.0)
+        regions = create_speaker_regions(
+            diarization_segments, max_gap=1.0, min_region_duration=min_region_duration
+        )
     else:
         # Convert segments to regions without grouping
         regions = [
@@ -178,68 +287,17 @@ def map_speakers_to_segments(
             for seg in diarization_segments
         ]
 
-    enhanced_segments = []
-    previous_speaker = None
-
-    for trans_seg in transcription_segments:
-        trans_start = trans_seg.start
-        trans_end = trans_seg.end
-        trans_duration = trans_end - trans_start
-
-        # Find best speaker using context-aware scoring
-        best_score = -1
-        best_speaker = 'UNKNOWN'
-        best_confidence = 0.0
-
-        for region in regions:
-            # Calculate overlap
-            overlap_start = max(trans_start, region.start)
-            overlap_end = min(trans_end, region.end)
-            overlap_duration = max(0, overlap_end - overlap_start)
-
-            if overlap_duration == 0:
-                continue  # No overlap, skip
-
-            # 1. Overlap score (how much of trans_seg overlaps with region)
-            overlap_score = overlap_duration / trans_duration if trans_duration > 0 else 0.0
-
-            # 2. Duration score (longer regions = more confident)
-            # Normalize to ~5 seconds
-            duration_score = min(1.0, region.duration / 5.0)
-
-            # 3. Temporal consistency score (prefer same speaker as previous)
-            if previous_speaker == region.speaker:
-                consistency_score = 0.8
-            else:
-                consistency_score = 0.2
-
-            # Weighted combination
-            final_score = (
-                overlap_score * overlap_weight + duration_score * duration_weight + consistency_score * temporal_consistency_weight
-            ) * region.confidence
-
-            if final_score > best_score:
-                best_score = final_score
-                best_speaker = region.speaker
-                best_confidence = overlap_score  # Use overlap as confidence
-
-        # If no overlap found, fall back to nearest speaker
-        if best_score < 0:
-            min_distance = float('inf')
-            for region in regions:
-                # Calculate distance to nearest boundary
-                distance = min(
-                    abs(trans_start - region.end),
-                    abs(trans_end - region.start),
-                    abs(trans_start - region.start),
-                    abs(trans_end - region.end),
-                )
+    assignments = _assign_speakers(
+        regions,
+        transcription_segments,
+        temporal_consistency_weight=temporal_consistency_weight,
+        duration_weight=duration_weight,
+        overlap_weight=overlap_weight,
+    )
 
-                if distance < min_distance:
-                    min_distance = distance
-                    best_speaker = region.speaker
-                    best_confidence = 0.1  # Low confidence for distance-based
+    enhanced_segments = []
 
+    for trans_seg, (best_speaker, best_confidence) in zip(transcription_segments, assignments):
         # Calculate transcription quality metrics
         avg_logprob = trans_seg.avg_logprob
         no_speech_prob = trans_seg.no_speech_prob
@@ -252,9 +310,9 @@ def map_speakers_to_segments(
         combined_confidence = best_confidence * transcription_quality
 
         enhanced_segment = EnhancedSegment(
-            start=trans_start,
-            end=trans_end,
-            text=trans_seg.text,
+            start=trans_seg.start,
+            end=trans_seg.end,
+            text=trans_seg.text.strip(),
             speaker=best_speaker,
             speaker_confidence=best_confidence,
             transcription_quality=transcription_quality,
@@ -265,11 +323,179 @@ def map_speakers_to_segments(
         )
 
         enhanced_segments.append(enhanced_segment)
-        previous_speaker = best_speaker  # Track for temporal consistency
 
     return enhanced_segments
 
 
+def _assign_speakers(
+    regions: List[SpeakerRegion],
+    transcription_segments: List[TranscriptionSegment],
+    temporal_consistency_weight: float,
+    duration_weight: float,
+    overlap_weight: float,
+) -> List[Tuple[str, float]]:
+    """Pick the best speaker region for each transcription segment.
+
+    Each candidate region is scored on overlap, region duration and temporal
+    consistency with the previously assigned speaker. Segments that overlap no
+    region fall back to the nearest region with low confidence.
+
+    Uses the compiled kernel from ``_combine_kernel`` when numba is installed,
+    otherwise a NumPy implementation with identical results.
+
+    Returns:
+        One ``(speaker, speaker_confidence)`` pair per transcription segment
+    """
+    num_regions = len(regions)
+    if not num_regions:
+        return [('UNKNOWN', 0.0)] * len(transcription_segments)
+
+    # Struct-of-arrays view of the regions, gathered in a single pass over the
+    # dataclasses: each transcription segment is scored against its candidate
+    # regions with a handful of vectorized operations
+    region_starts, region_ends, region_durations, region_confidences = np.array(
+        [(r.start, r.end, r.duration, r.confidence) for r in regions], dtype=np.float64
+    ).T.copy()
+    # Interned so every segment shares one string object per speaker, which
+    # keeps the later per-speaker dict and set work on identity hits
+    region_speakers = [sys.intern(r.speaker) for r in regions]
+    speaker_ids = {speaker: i for i, speaker in enumerate(dict.fromkeys(region_speakers))}
+    region_speaker_ids = np.fromiter(
+        (speaker_ids[speaker] for speaker in region_speakers), dtype=np.int64, count=num_regions
+    )
+
+    # 2. Duration score (longer regions = more confident), normalized to ~5 seconds.
+    # It does not depend on the transcription segment, so compute it once.
+    duration_scores = np.minimum(1.0, region_durations / 5.0)
+
+    # Regions come out of diarization in start order, so the regions that can
+    # overlap [trans_start, trans_end] form a contiguous window found by binary
+    # search. Ends are not monotonic when speech overlaps, hence the running max.
+    # Unsorted input falls back to scanning every region.
+    windowed = num_regions > 1 and bool(np.all(region_starts[1:] >= region_starts[:-1]))
+
+    trans_bounds = [(s.start, s.end) for s in transcription_segments]
+
+    if NUMBA_AVAILABLE:
+        trans_starts, trans_ends = np.array(trans_bounds, dtype=np.float64).reshape(-1, 2).T.copy()
+        best_regions, best_confidences = score_segments(
+            trans_starts,
+            trans_ends,
+            region_starts,
+            region_ends,
+            duration_scores,
+            region_confidences,
+            region_speaker_ids,
+            windowed,
+            overlap_weight,
+            duration_weight,
+            temporal_consistency_weight,
+        )
+        return [
+            (region_speakers[best], confidence)
+            for best, confidence in zip(best_regions.tolist(), best_confidences.tolist())
+        ]
+
+    start_list = region_starts.tolist()
+    end_list = region_ends.tolist()
+    if windowed:
+        max_ends = np.maximum.accumulate(region_ends)
+        window_max_ends = max_ends.tolist()
+        # Index of the (first) region holding each running max end
+        new_max = np.empty(num_regions, dtype=bool)
+        new_max[0] = True
+        new_max[1:] = region_ends[1:] > max_ends[:-1]
+        latest_end_index = np.maximum.accumulate(np.where(new_max, np.arange(num_regions), 0)).tolist()
+        # Binary-searched nearest fallback needs well-formed regions
+        bounded = bool(np.all(region_ends >= region_starts))
+
+    assignments = []
+    previous_speaker_id = -1
+
+    for trans_start, trans_end in trans_bounds:
+        trans_duration = trans_end - trans_start
+
+        # Candidate window: regions before lo end by trans_start, regions from hi start at/after trans_end
+        if windowed:
+            lo = bisect.bisect_right(window_max_ends, trans_start)
+            hi = bisect.bisect_left(start_list, trans_end)
+        else:
+            lo, hi = 0, num_regions
+
+        if hi - lo == 1:
+            # A lone candidate wins outright if it overlaps at all, so the
+            # weighted scoring can be skipped
+            overlap = min(trans_end, end_list[lo]) - max(trans_start, start_list[lo])
+            if overlap > 0:
+                assignments.append((region_speakers[lo], overlap / trans_duration))
+                previous_speaker_id = region_speaker_ids[lo]
+                continue
+
+        # Calculate overlap with every candidate region
+        overlap_durations = np.minimum(trans_end, region_ends[lo:hi]) - np.maximum(
+            trans_start, region_starts[lo:hi]
+        )
+        overlapping = overlap_durations > 0
+
+        if overlapping.any():
+            # 1. Overlap score (how much of trans_seg overlaps with region);
+            # any overlap implies trans_duration > 0
+            overlap_scores = overlap_durations / trans_duration
+
+            # 3. Temporal consistency score (prefer same speaker as previous)
+            consistency_scores = np.where(
+                region_speaker_ids[lo:hi] == previous_speaker_id, 0.8, 0.2
+            )
+
+            # Weighted combination
+            final_scores = (
+                overlap_scores * overlap_weight
+                + duration_scores[lo:hi] * duration_weight
+                + consistency_scores * temporal_consistency_weight
+            ) * region_confidences[lo:hi]
+            final_scores[~overlapping] = -np.inf
+
+            # argmax returns the first maximum, i.e. the earliest region on ties
+            best = int(np.argmax(final_scores))
+            best_confidence = float(overlap_scores[best])  # Use overlap as confidence
+            best += lo
+        elif windowed and bounded and trans_end >= trans_start:
+            # No overlap found, fall back to nearest speaker (distance to nearest boundary).
+            # Regions before the window all end by trans_start, so the nearest of them
+            # is the one with the latest end; regions after it all start at or after
+            # trans_end, so the nearest is the first. Only the window needs scanning.
+            best = -1
+            best_distance = np.inf
+            if lo > 0:
+                best = latest_end_index[lo - 1]
+                best_distance = trans_start - end_list[best]
+            if lo < hi:
+                distances = np.minimum(
+                    np.minimum(np.abs(trans_start - region_ends[lo:hi]), np.abs(trans_end - region_starts[lo:hi])),
+                    np.minimum(np.abs(trans_start - region_starts[lo:hi]), np.abs(trans_end - region_ends[lo:hi])),
+                )
+                nearest = int(np.argmin(distances))
+                if distances[nearest] < best_distance:
+                    best = lo + nearest
+                    best_distance = distances[nearest]
+            if hi < num_regions and start_list[hi] - trans_end < best_distance:
+                best = hi
+            best_confidence = 0.1  # Low confidence for distance-based
+        else:
+            # No overlap found, fall back to nearest speaker (distance to nearest boundary)
+            distances = np.minimum(
+                np.minimum(np.abs(trans_start - region_ends), np.abs(trans_end - region_starts)),
+                np.minimum(np.abs(trans_start - region_starts), np.abs(trans_end - region_ends)),
+            )
+            best = int(np.argmin(distances))
+            best_confidence = 0.1  # Low confidence for distance-based
+
+        assignments.append((region_speakers[best], best_confidence))
+        previous_speaker_id = region_speaker_ids[best]  # Track for temporal consistency
+
+    return assignments
+
+
 def _split_into_paragraphs(text: str, max_length: int = 500) -> List[str]:
     """Split long text into paragraphs at sentence boundaries.
 
@@ -283,20 +509,11 @@ def _split_into_paragraphs(text: str, max_length: int = 500) -> List[str]:
     if len(text) <= max_length:
         return [text]
 
-    # Split into sentences (basic split on . ! ?)
-    import re
-
-    sentences = re.split(r'([.!?]+\s+)', text)
-
+    # Split into sentences (basic split on . ! ?), punctuation included
     paragraphs = []
     current_para = ""
 
-    for i in range(0, len(sentences), 2):
-        sentence = sentences[i]
-        # Add punctuation back if it exists
-        if i + 1 < len(sentences):
-            sentence += sentences[i + 1]
-
+    for sentence in filter(None, _SENTENCE_RE.findall(text)):
         # If adding this sentence would exceed max_length, start new paragraph
         if current_para and len(current_para) + len(sentence) > max_length:
             paragraphs.append(current_para.strip())
@@ -311,8 +528,44 @@ def _split_into_paragraphs(text: str, max_length: int = 500) -> List[str]:
     return paragraphs if paragraphs else [text]
 
 
+# Per-speaker (durations, segment counts, confidence sums), see _speaker_stats()
+SpeakerStats = Tuple[Dict[str, float], Dict[str, int], Dict[str, float]]
+
+# Extra output format for combine_results: writes (segments, stats) to a stream
+Renderer = Callable[[List[EnhancedSegment], SpeakerStats, IO[str]], Any]
+
+
+def _speaker_stats(segments: List[EnhancedSegment]) -> SpeakerStats:
+    """Accumulate per-speaker totals in a single pass over the segments.
+
+    Returns:
+        Speaking time, segment count and combined-confidence sum per speaker,
+        all keyed in sorted speaker order
+    """
+    durations: Dict[str, float] = defaultdict(float)
+    counts: Dict[str, int] = defaultdict(int)
+    confidence_sums: Dict[str, float] = defaultdict(float)
+
+    for seg in segments:
+        speaker = seg.speaker
+        durations[speaker] += seg.end - seg.start
+        counts[speaker] += 1
+        confidence_sums[speaker] += seg.combined_confidence
+
+    speakers = sorted(durations)
+    return (
+        {speaker: durations[speaker] for speaker in speakers},
+        {speaker: counts[speaker] for speaker in speakers},
+        {speaker: confidence_sums[speaker] for speaker in speakers},
+    )
+
+
 def create_combined_transcript(
-    enhanced_segments: List[EnhancedSegment], audio_file: Path, include_confidence: bool = True
+    enhanced_segments: List[EnhancedSegment],
+    audio_file: Path,
+    include_confidence: bool = True,
+    stats: Optional[SpeakerStats] = None,
+    out: Optional[IO[str]] = None,
 ) -> str:
     """
     Create formatted transcript with speaker labels and improved readability.
@@ -326,27 +579,33 @@ def create_combined_transcript(
         enhanced_segments: List of segments with speaker labels
         audio_file: Original audio file path
         include_confidence: Whether to include confidence scores in output
+        stats: Precomputed ``_speaker_stats(enhanced_segments)``, if the caller
+            already has it
+        out: Text stream to write the transcript to as it is formatted,
+            e.g. an open output file. By default it is built in memory.
 
     Returns:
-        Formatted markdown transcript
+        Formatted markdown transcript, or an empty string when written to ``out``
     """
-    lines = []
+    buf = io.StringIO()
+    stream: IO[str] = buf if out is None else out
+    write = stream.write
 
     # Header
-    lines.append(f"# Combined Speaker Diarization and Transcription\n")
-    lines.append(f"**Audio File:** {audio_file.name}\n")
-    lines.append(f"**Processing Date:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    lines.append(f"\n## Full Transcript with Speaker Labels\n")
+    write("# Combined Speaker Diarization and Transcription\n\n")
+    write(f"**Audio File:** {audio_file.name}\n\n")
+    write(f"**Processing Date:** {_dt.now().isoformat(sep=' ', timespec='seconds')}\n\n")
+    write("\n## Full Transcript with Speaker Labels\n\n")
 
     # Group consecutive segments by speaker
     current_speaker = None
-    current_segments = []
+    current_segments: List[EnhancedSegment] = []
 
     for seg in enhanced_segments:
         if seg.speaker != current_speaker:
             # Process previous group
             if current_segments:
-                _format_speaker_turn(lines, current_speaker, current_segments, include_confidence)
+                _format_speaker_turn(stream, current_speaker, current_segments, include_confidence)
 
             current_speaker = seg.speaker
             current_segments = [seg]
@@ -355,42 +614,32 @@ def create_combined_transcript(
 
     # Process last group
     if current_segments:
-        _format_speaker_turn(lines, current_speaker, current_segments, include_confidence)
+        _format_speaker_turn(stream, current_speaker, current_segments, include_confidence)
 
     # Detailed breakdown
-    lines.append(f"\n## Detailed Breakdown by Segments\n")
+    write("\n## Detailed Breakdown by Segments\n\n")
 
     for seg in enhanced_segments:
-        line = f"**[{seg.speaker}] [{seg.start:.3f}s - {seg.end:.3f}s]** {seg.text.strip()}\n"
+        write(f"**[{seg.speaker}] [{seg.start:.3f}s - {seg.end:.3f}s]** {seg.text}\n")
         if include_confidence:
             confidence_pct = seg.combined_confidence * 100
             confidence_indicator = "✓" if confidence_pct >= 70 else "⚠" if confidence_pct >= 50 else "✗"
-            line += f"  *{confidence_indicator} Confidence: {confidence_pct:.1f}% | Quality: {seg.transcription_quality:.2f}*\n"
-        lines.append(line)
+            write(
+                f"  *{confidence_indicator} Confidence: {confidence_pct:.1f}% | Quality: {seg.transcription_quality:.2f}*\n"
+            )
+        write("\n")
 
     # Speaking time distribution
-    lines.append(f"\n## Speaking Time Distribution\n")
-
-    speaker_durations = {}
-    speaker_segments_count = {}
-    speaker_confidence_sums = {}
-
-    for seg in enhanced_segments:
-        speaker = seg.speaker
-        duration = seg.end - seg.start
-
-        if speaker not in speaker_durations:
-            speaker_durations[speaker] = 0
-            speaker_segments_count[speaker] = 0
-            speaker_confidence_sums[speaker] = 0
+    write("\n## Speaking Time Distribution\n\n")
 
-        speaker_durations[speaker] += duration
-        speaker_segments_count[speaker] += 1
-        speaker_confidence_sums[speaker] += seg.combined_confidence
+    if stats is None:
+        stats = _speaker_stats(enhanced_segments)
+    speaker_durations, speaker_segments_count, speaker_confidence_sums = stats
 
     total_duration = sum(speaker_durations.values())
 
-    for speaker in sorted(speaker_durations.keys()):
+    # The stats are already keyed in sorted speaker order
+    for speaker in speaker_durations:
         duration = speaker_durations[speaker]
         percentage = (duration / total_duration) * 100 if total_duration > 0 else 0
         avg_confidence = (
@@ -399,56 +648,88 @@ def create_combined_transcript(
             else 0
         )
 
-        lines.append(f"### {speaker}\n")
-        lines.append(f"- **Speaking time:** {duration:.2f}s ({percentage:.1f}% of total)\n")
-        lines.append(f"- **Segments:** {speaker_segments_count[speaker]}\n")
-        lines.append(f"- **Average confidence:** {avg_confidence:.3f}\n")
+        write(f"### {speaker}\n\n")
+        write(f"- **Speaking time:** {duration:.2f}s ({percentage:.1f}% of total)\n\n")
+        write(f"- **Segments:** {speaker_segments_count[speaker]}\n\n")
+        write(f"- **Average confidence:** {avg_confidence:.3f}\n\n")
 
     # Overall statistics
-    lines.append(f"\n## General Statistics\n")
-    speakers = set(seg.speaker for seg in enhanced_segments)
-    lines.append(f"- **Total speakers:** {len(speakers)}\n")
-    lines.append(f"- **Total duration:** {total_duration:.2f}s\n")
-    lines.append(f"- **Total segments:** {len(enhanced_segments)}\n")
-    lines.append(f"- **Speakers:** {', '.join(sorted(speakers))}\n")
+    write("\n## General Statistics\n\n")
+    speakers = speaker_durations.keys()
+    write(f"- **Total speakers:** {len(speakers)}\n\n")
+    write(f"- **Total duration:** {total_duration:.2f}s\n\n")
+    write(f"- **Total segments:** {len(enhanced_segments)}\n\n")
+    write(f"- **Speakers:** {', '.join(speakers)}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def _format_speaker_turn(
-    lines: List[str], speaker: str, segments: List[EnhancedSegment], include_confidence: bool
+    out: IO[str], speaker: str, segments: List[EnhancedSegment], include_confidence: bool
 ) -> None:
     """Format a speaker turn with paragraph breaks for long text.
 
     Args:
-        lines: List to append formatted lines to
+        out: Text stream to write the formatted turn to
         speaker: Speaker ID
         segments: Segments for this speaker turn
         include_confidence: Whether to show confidence indicators
     """
-    combined_text = " ".join([s.text.strip() for s in segments])
+    # Gather the turn's text and its total confidence in one pass
+    texts = []
+    total_confidence = 0.0
+    for s in segments:
+        texts.append(s.text)
+        total_confidence += s.combined_confidence
+    combined_text = " ".join(texts)
+
     first_start = segments[0].start
     last_end = segments[-1].end
     turn_duration = last_end - first_start
 
     # Calculate average confidence for this turn
-    avg_confidence = sum(s.combined_confidence for s in segments) / len(segments) if segments else 0.0
+    avg_confidence = total_confidence / len(segments) if segments else 0.0
 
-    lines.append(f"### {speaker}\n")
-    lines.append(f"**Time:** [{first_start:.3f}s - {last_end:.3f}s] ({turn_duration:.1f}s)\n")
+    write = out.write
+    write(f"### {speaker}\n\n")
+    write(f"**Time:** [{first_start:.3f}s - {last_end:.3f}s] ({turn_duration:.1f}s)\n\n")
 
     if include_confidence:
         confidence_pct = avg_confidence * 100
         confidence_indicator = "✓" if confidence_pct >= 70 else "⚠" if confidence_pct >= 50 else "✗"
-        lines.append(f"*{confidence_indicator} Avg confidence: {confidence_pct:.1f}%*\n")
+        write(f"*{confidence_indicator} Avg confidence: {confidence_pct:.1f}%*\n\n")
 
     # Split long text into paragraphs
     paragraphs = _split_into_paragraphs(combined_text, max_length=500)
 
     for para in paragraphs:
-        lines.append(f"\n{para}\n")
+        write(f"\n{para}\n\n")
+
+    write("\n\n")  # Add spacing between speaker turns
+
+
+def _write_outputs(outputs: Dict[Path, Callable[[IO[str]], Any]]) -> None:
+    """Write each output file by calling its render function on the open file.
+
+    Several files are written from a thread pool so their disk writes overlap;
+    a single file is written inline.
+
+    Args:
+        outputs: Render function for each output path
+    """
+
+    def write(path: Path, render: Callable[[IO[str]], Any]) -> None:
+        with open(path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            render(f)
 
-    lines.append("\n")  # Add spacing between speaker turns
+    if len(outputs) == 1:
+        write(*next(iter(outputs.items())))
+        return
+
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        futures = [executor.submit(write, path, render) for path, render in outputs.items()]
+        for future in futures:
+            future.result()  # Re-raise the first failure
 
 
 def combine_results(
@@ -457,6 +738,7 @@ def combine_results(
     output_dir: Path,
     save_markdown: bool = True,
     include_confidence: bool = True,
+    renderers: Optional[List[Tuple[str, Renderer]]] = None,
 ) -> CombinationResult:
     """
     Combine diarization and transcription results into speaker-labeled transcript.
@@ -465,8 +747,13 @@ def combine_results(
         diarization_result: Result from speaker diarization
         transcription_result: Result from transcription
         output_dir: Directory for output files
-        save_markdown: Whether to save combined result as markdown
+        save_markdown: Whether to save combined result as markdown. When False
+            the transcript is not formatted at all and ``output_file`` is None.
         include_confidence: Whether to include confidence scores in output
+        renderers: Extra output formats as ``(suffix, renderer)`` pairs. Each
+            renderer is called as ``renderer(segments, stats, out)`` and writes
+            to ``<audio stem><suffix>`` in output_dir. The paths written are
+            listed in ``metadata['output_files']``.
 
     Returns:
         CombinationResult with combined transcript
@@ -477,39 +764,45 @@ def combine_results(
     try:
         # Map speakers to transcription segments
         enhanced_segments = map_speakers_to_segments(diarization_result.segments, transcription_result.segments)
+        audio_file = transcription_result.audio_file
 
-        # Calculate speaker durations from enhanced segments
-        speaker_durations = {}
-        for seg in enhanced_segments:
-            if seg.speaker not in speaker_durations:
-                speaker_durations[seg.speaker] = 0
-            speaker_durations[seg.speaker] += seg.end - seg.start
-
-        # Create combined transcript
-        transcript_text = create_combined_transcript(
-            enhanced_segments, transcription_result.audio_file, include_confidence
-        )
+        # Per-speaker totals, shared with the transcript's statistics sections
+        stats = _speaker_stats(enhanced_segments)
+        speaker_durations = stats[0]
 
-        # Save to file if requested
+        # Format outputs only if they are being saved, streaming them straight to disk
         output_file = None
+        outputs = {}
         if save_markdown:
+            output_file = output_dir / f"{audio_file.stem}_combined.md"
+            outputs[output_file] = lambda out: create_combined_transcript(
+                enhanced_segments, audio_file, include_confidence, stats=stats, out=out
+            )
+        for suffix, renderer in renderers or ():
+            outputs[output_dir / f"{audio_file.stem}{suffix}"] = functools.partial(
+                renderer, enhanced_segments, stats
+            )
+
+        if outputs:
             output_dir.mkdir(parents=True, exist_ok=True)
-            output_file = output_dir / f"{transcription_result.audio_file.stem}_combined.md"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(transcript_text)
+            _write_outputs(outputs)
+
+        metadata = {
+            'diarization_model': diarization_result.metadata.get('model'),
+            'transcription_model': transcription_result.metadata.get('model_size'),
+            'transcription_implementation': transcription_result.implementation,
+        }
+        if renderers:
+            metadata['output_files'] = list(outputs)
 
         return CombinationResult(
             success=True,
-            audio_file=transcription_result.audio_file,
+            audio_file=audio_file,
             segments=enhanced_segments,
-            num_speakers=len(set(seg.speaker for seg in enhanced_segments)),
+            num_speakers=len(speaker_durations),
             speaker_durations=speaker_durations,
             output_file=output_file,
-            metadata={
-                'diarization_model': diarization_result.metadata.get('model'),
-                'transcription_model': transcription_result.metadata.get('model_size'),
-                'transcription_implementation': transcription_result.implementation,
-            },
+            metadata=metadata,
         )
 
     except Exception as e:
@@ -542,7 +835,8 @@ def combine_from_files(
         transcription_file: Path to transcription JSON file
         audio_file: Original audio file
         output_dir: Directory for output files
-        save_markdown: Whether to save combined result
+        save_markdown: Whether to save combined result. When False the
+            transcript is not formatted at all and ``output_file`` is None.
 
     Returns:
         CombinationResult with combined transcript
@@ -555,8 +849,7 @@ def combine_from_files(
         diarization_segments = _load_diarization_from_markdown(diarization_file)
 
         # Load transcription results from JSON
-        with open(transcription_file, 'r', encoding='utf-8') as f:
-            trans_data = json.load(f)
+        trans_data = _json_loads(Path(transcription_file).read_bytes())
 
         # Convert to TranscriptionSegment objects
         from .transcription import TranscriptionSegment
@@ -578,29 +871,25 @@ def combine_from_files(
         # Map speakers to segments
         enhanced_segments = map_speakers_to_segments(diarization_segments, transcription_segments)
 
-        # Create combined transcript
-        transcript_text = create_combined_transcript(enhanced_segments, Path(audio_file), include_confidence=True)
+        # Per-speaker totals, shared with the transcript's statistics sections
+        stats = _speaker_stats(enhanced_segments)
+        speaker_durations = stats[0]
 
-        # Save to file
+        # Format the transcript only if it is being saved, streaming it straight to disk
         output_file = None
         if save_markdown:
             output_dir.mkdir(parents=True, exist_ok=True)
             output_file = output_dir / f"{Path(audio_file).stem}_combined.md"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(transcript_text)
-
-        # Calculate speaker durations
-        speaker_durations = {}
-        for seg in enhanced_segments:
-            if seg.speaker not in speaker_durations:
-                speaker_durations[seg.speaker] = 0
-            speaker_durations[seg.speaker] += seg.end - seg.start
+            with open(output_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                create_combined_transcript(
+                    enhanced_segments, Path(audio_file), include_confidence=True, stats=stats, out=f
+                )
 
         return CombinationResult(
             success=True,
             audio_file=Path(audio_file),
             segments=enhanced_segments,
-            num_speakers=len(set(seg.speaker for seg in enhanced_segments)),
+            num_speakers=len(speaker_durations),
             speaker_durations=speaker_durations,
             output_file=output_file,
         )
@@ -623,39 +912,18 @@ def _load_diarization_from_markdown(diarization_file: Path) -> List[Dict[str, An
         content = f.read()
 
     segments = []
-    lines = content.split('\n')
-    in_table = False
-    header_found = False
-
-    for line in lines:
-        if 'Speaker Segments' in line or 'Regular Speaker Diarization' in line:
-            in_table = True
-            header_found = False
-            continue
 
-        if in_table:
-            if line.strip() == '':
+    for table in _DIARIZATION_TABLE_RE.finditer(content):
+        for row in _DIARIZATION_ROW_RE.finditer(table.group(1)):
+            speaker, start, end, duration = row.groups()
+            try:
+                segments.append({
+                    'speaker': sys.intern(speaker),
+                    'start': float(start),
+                    'end': float(end),
+                    'duration': float(duration),
+                })
+            except ValueError:
                 continue
 
-            if line.startswith('|---'):
-                header_found = True
-                continue
-
-            if line.startswith('|') and header_found:
-                parts = [part.strip() for part in line.split('|')]
-                parts = [part for part in parts if part != '']
-
-                if len(parts) >= 4:
-                    try:
-                        segments.append({
-                            'speaker': parts[0],
-                            'start': float(parts[1]),
-                            'end': float(parts[2]),
-                            'duration': float(parts[3]),
-                        })
-                    except ValueError:
-                        continue
-            elif not line.startswith('|'):
-                in_table = False
-
     return segments
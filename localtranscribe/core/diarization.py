@@ -11,17 +11,30 @@ from pyannote.audio.pipelines.utils.hook import ProgressHook
 from pydub import AudioSegment
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple
+from collections import defaultdict
 from dataclasses import dataclass, field
 import warnings
 import time
 import os
+import hashlib
+import threading
+from contextlib import nullcontext
 
 from ..utils.errors import DiarizationError, HuggingFaceTokenError, InvalidAudioFormatError
-from ..utils.download import wrap_model_download, check_model_cached, loading_spinner
+from ..utils.download import wrap_model_download, check_model_cached, loading_spinner, progress_display_enabled
 
 # Suppress warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="pyannote.audio")
 
+# Loaded pipelines keyed by (model name, token digest, device), so processing
+# several files in one process loads the model only once
+_PIPELINE_CACHE: Dict[Tuple[str, str, str], Pipeline] = {}
+_PIPELINE_CACHE_LOCK = threading.Lock()
+
+# Cached pipelines are shared by every thread, and pyannote does not document
+# them as thread-safe, so diarization runs one file at a time
+_PIPELINE_RUN_LOCK = threading.Lock()
+
 
 @dataclass
 class DiarizationResult:
@@ -127,6 +140,7 @@ def load_diarization_pipeline(
     hf_token: str,
     model_name: str = "pyannote/speaker-diarization-3.1",
     device: Optional[torch.device] = None,
+    use_cache: bool = True,
 ) -> Pipeline:
     """
     Load pyannote speaker diarization pipeline.
@@ -135,6 +149,7 @@ def load_diarization_pipeline(
         hf_token: HuggingFace access token
         model_name: Model identifier on HuggingFace
         device: Device to load model on (default: auto-detect)
+        use_cache: Reuse a pipeline already loaded in this process
 
     Returns:
         Loaded pipeline ready for diarization
@@ -142,6 +157,13 @@ def load_diarization_pipeline(
     Raises:
         HuggingFaceTokenError: If token is invalid or model cannot be loaded
     """
+    cache_key = (model_name, hashlib.sha256((hf_token or "").encode()).hexdigest(), str(device))
+    if use_cache:
+        with _PIPELINE_CACHE_LOCK:
+            cached = _PIPELINE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
         # Load pipeline with progress indicator
         def _load_pipeline():
@@ -159,6 +181,11 @@ def load_diarization_pipeline(
             if device.type in ['mps', 'cuda']:
                 pipeline.to(device)
 
+        if use_cache:
+            # Another thread may have finished loading first; share its copy
+            with _PIPELINE_CACHE_LOCK:
+                pipeline = _PIPELINE_CACHE.setdefault(cache_key, pipeline)
+
         return pipeline
 
     except Exception as e:
@@ -192,6 +219,12 @@ def load_diarization_pipeline(
             )
 
 
+def clear_pipeline_cache() -> None:
+    """Drop all diarization pipelines cached by ``load_diarization_pipeline``."""
+    with _PIPELINE_CACHE_LOCK:
+        _PIPELINE_CACHE.clear()
+
+
 def run_diarization(
     audio_file: Path,
     hf_token: str,
@@ -246,38 +279,40 @@ def run_diarization(
         if max_speakers:
             diarization_args['max_speakers'] = max_speakers
 
-        # Run diarization with progress monitoring
-        try:
-            waveform, sample_rate = torchaudio.load(str(processed_audio))
-            with ProgressHook() as hook:
-                diarization_output = pipeline(
-                    {"waveform": waveform, "sample_rate": sample_rate},
-                    hook=hook,
-                    **diarization_args
-                )
-        except Exception:
-            # Fallback to file path method
-            with ProgressHook() as hook:
-                diarization_output = pipeline(str(processed_audio), hook=hook, **diarization_args)
+        # Run diarization with progress monitoring (main thread only; the
+        # hook draws a live progress bar)
+        def _progress_hook():
+            return ProgressHook() if progress_display_enabled() else nullcontext()
+
+        with _PIPELINE_RUN_LOCK:
+            try:
+                waveform, sample_rate = torchaudio.load(str(processed_audio))
+                with _progress_hook() as hook:
+                    diarization_output = pipeline(
+                        {"waveform": waveform, "sample_rate": sample_rate},
+                        hook=hook,
+                        **diarization_args
+                    )
+            except Exception:
+                # Fallback to file path method
+                with _progress_hook() as hook:
+                    diarization_output = pipeline(str(processed_audio), hook=hook, **diarization_args)
 
         # Process results
         segments = []
-        speaker_durations = {}
-        speakers = set()
+        speaker_durations: Dict[str, float] = defaultdict(float)
 
         for turn, speaker in diarization_output.speaker_diarization:
-            speaker_label = speaker
+            duration = turn.end - turn.start
             segments.append({
-                'speaker': speaker_label,
+                'speaker': speaker,
                 'start': turn.start,
                 'end': turn.end,
-                'duration': turn.end - turn.start,
+                'duration': duration,
             })
+            speaker_durations[speaker] += duration
 
-            speakers.add(speaker_label)
-            if speaker_label not in speaker_durations:
-                speaker_durations[speaker_label] = 0
-            speaker_durations[speaker_label] += turn.end - turn.start
+        speaker_durations = dict(speaker_durations)
 
         # Clean up processed file if needed
         if cleanup_processed and processed_audio.exists():
@@ -304,7 +339,7 @@ def run_diarization(
             success=True,
             audio_file=audio_file,
             processing_time=processing_time,
-            num_speakers=len(speakers),
+            num_speakers=len(speaker_durations),
             segments=segments,
             speaker_durations=speaker_durations,
             output_file=output_file,
@@ -8,11 +8,20 @@ applying temporal smoothing to reduce false speaker switches.
 Based on research and best practices from pyannote.audio and the IMPROVEMENT_PLAN.md.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from pathlib import Path
 import logging
 
+import numpy as np
+
+from ._segment_kernel import (
+    NUMBA_AVAILABLE as SEGMENT_KERNEL_AVAILABLE,
+    process_segments as process_segments_kernel,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,18 +31,24 @@ class SegmentProcessingConfig:
 
     Attributes:
         min_segment_duration: Minimum duration (seconds) for a segment to be kept.
-            Segments shorter than this are filtered out.
+            Segments shorter than this are filtered out. Set to 0 to disable filtering.
         merge_gap_threshold: Maximum gap (seconds) between consecutive same-speaker
             segments to merge them together.
         min_speaker_turn: Minimum duration (seconds) for a speaker turn after merging.
+        min_region_duration: Speaker regions shorter than this (seconds) are folded
+            into a neighbouring region during speaker mapping. 0 disables folding.
         smoothing_window: Time window (seconds) for temporal smoothing of speaker transitions.
         enabled: Whether segment processing is enabled.
+        lazy_stats: Compute the speaker-switch and average-duration statistics
+            only when ``metadata['segment_processing']['stats']`` is first read.
     """
     min_segment_duration: float = 0.3
     merge_gap_threshold: float = 1.0
     min_speaker_turn: float = 2.0
+    min_region_duration: float = 0.0
     smoothing_window: float = 2.0
     enabled: bool = True
+    lazy_stats: bool = False
 
 
 @dataclass
@@ -54,6 +69,45 @@ class SegmentProcessingStats:
     avg_segment_duration_after: float = 0.0
 
 
+class _LazyStats(Mapping):
+    """Read-only stats mapping whose summary figures are computed on first access.
+
+    Holds the segment arrays from before and after processing until a value
+    is read; call ``dict(stats)`` to materialize it, e.g. before serializing.
+    """
+
+    def __init__(self, stats: SegmentProcessingStats, summarize: Callable, before: Tuple, after: Tuple):
+        self._stats = stats
+        self._summarize = summarize
+        self._before: Optional[Tuple] = before
+        self._after: Optional[Tuple] = after
+
+    @cached_property
+    def _values(self) -> Dict[str, Any]:
+        stats = self._stats
+        if self._before is not None and self._after is not None:
+            speaker_ids, starts, ends = self._before
+            stats.speaker_switches_before, stats.avg_segment_duration_before = self._summarize(
+                speaker_ids, ends - starts
+            )
+            speaker_ids, durations = self._after
+            stats.speaker_switches_after, stats.avg_segment_duration_after = self._summarize(
+                speaker_ids, durations
+            )
+            # The arrays are no longer needed once summarized
+            self._before = self._after = None
+        return _stats_dict(stats)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
 class SegmentProcessor:
     """Post-process diarization segments for improved quality.
 
@@ -76,7 +130,30 @@ class SegmentProcessor:
             config: Configuration for processing. If None, uses default values.
         """
         self.config = config or SegmentProcessingConfig()
-        logger.info(f"Initialized SegmentProcessor with config: {self.config}")
+        self._passes = self._build_passes()
+        logger.info("Initialized SegmentProcessor with config: %s", self.config)
+
+    def _build_passes(self) -> List[Callable]:
+        """Select the processing passes needed for the current config.
+
+        Filtering is skipped entirely when ``min_segment_duration`` is not
+        positive. Smoothing always runs, since it also collapses same-speaker
+        neighbours left apart by the gap threshold. With numba installed all
+        passes run through the compiled kernel instead.
+
+        Returns:
+            Passes to apply in order, each taking and returning
+            (starts, ends, speaker_ids)
+        """
+        if SEGMENT_KERNEL_AVAILABLE:
+            return [self._process_compiled]
+
+        passes = []
+        if self.config.min_segment_duration > 0:
+            passes.append(self._filter_micro_segments)
+        passes.append(self._merge_consecutive_segments)
+        passes.append(self._smooth_speaker_transitions)
+        return passes
 
     def process(self, diarization_result):
         """Process diarization result to improve segment quality.
@@ -105,242 +182,322 @@ class SegmentProcessor:
             logger.warning("No segments to process")
             return diarization_result
 
+        # Work on a struct-of-arrays view: starts, ends and integer speaker ids
+        starts, ends, speaker_ids, labels = _to_soa(segments)
+
         # Initialize statistics
         stats = SegmentProcessingStats()
         stats.original_segment_count = len(segments)
-        stats.speaker_switches_before = self._count_speaker_switches(segments)
-        stats.avg_segment_duration_before = self._calculate_avg_duration(segments)
-
-        logger.info(f"Processing {len(segments)} segments...")
-        logger.info(f"Original stats: {stats.speaker_switches_before} speaker switches, "
-                   f"avg duration {stats.avg_segment_duration_before:.2f}s")
+        stats.filtered_segment_count = len(segments)
+        lazy_stats = self.config.lazy_stats
+
+        logger.info("Processing %d segments...", len(segments))
+        if lazy_stats:
+            before = (speaker_ids, starts, ends)
+        else:
+            stats.speaker_switches_before, stats.avg_segment_duration_before = self._summarize(
+                speaker_ids, ends - starts
+            )
+            logger.info("Original stats: %d speaker switches, avg duration %.2fs",
+                        stats.speaker_switches_before, stats.avg_segment_duration_before)
 
-        # Step 1: Filter micro-segments
-        segments = self._filter_micro_segments(segments, stats)
-        logger.info(f"After filtering: {len(segments)} segments "
-                   f"({stats.micro_segments_removed} micro-segments removed)")
+        # Filter micro-segments, merge same-speaker runs, smooth transitions
+        for process_pass in self._passes:
+            starts, ends, speaker_ids = process_pass(starts, ends, speaker_ids, stats)
 
-        # Step 2: Merge consecutive same-speaker segments
-        segments = self._merge_consecutive_segments(segments, stats)
-        logger.info(f"After merging: {len(segments)} segments")
+        logger.info("After filtering: %d segments (%d micro-segments removed)",
+                    stats.filtered_segment_count, stats.micro_segments_removed)
+        logger.info("After merging: %d segments", stats.filtered_segment_count - stats.merged_segment_count)
+        logger.info("After smoothing: %d segments (%d transitions smoothed)",
+                    len(starts), stats.smoothed_segment_count)
 
-        # Step 3: Smooth speaker transitions
-        segments = self._smooth_speaker_transitions(segments, stats)
-        logger.info(f"After smoothing: {len(segments)} segments "
-                   f"({stats.smoothed_segment_count} transitions smoothed)")
+        # Final durations feed the stats, the speaker totals and the output segments
+        durations = ends - starts
 
         # Update final statistics
-        stats.final_segment_count = len(segments)
-        stats.speaker_switches_after = self._count_speaker_switches(segments)
-        stats.avg_segment_duration_after = self._calculate_avg_duration(segments)
+        stats.final_segment_count = len(starts)
+        if not lazy_stats:
+            stats.speaker_switches_after, stats.avg_segment_duration_after = self._summarize(
+                speaker_ids, durations
+            )
 
         # Recalculate speaker durations
-        speaker_durations = self._calculate_speaker_durations(segments)
+        speaker_durations = self._calculate_speaker_durations(durations, speaker_ids, labels)
 
         # Update the result
-        diarization_result.segments = segments
+        diarization_result.segments = _from_soa(starts, ends, durations, speaker_ids, labels)
         diarization_result.speaker_durations = speaker_durations
 
         # Add processing stats to metadata
         if 'segment_processing' not in diarization_result.metadata:
             diarization_result.metadata['segment_processing'] = {}
 
-        diarization_result.metadata['segment_processing']['stats'] = {
-            'original_segment_count': stats.original_segment_count,
-            'final_segment_count': stats.final_segment_count,
-            'micro_segments_removed': stats.micro_segments_removed,
-            'merged_segment_count': stats.merged_segment_count,
-            'smoothed_segment_count': stats.smoothed_segment_count,
-            'speaker_switches_before': stats.speaker_switches_before,
-            'speaker_switches_after': stats.speaker_switches_after,
-            'switch_reduction_pct': (
-                100 * (stats.speaker_switches_before - stats.speaker_switches_after) /
-                stats.speaker_switches_before if stats.speaker_switches_before > 0 else 0
-            ),
-            'avg_segment_duration_before': stats.avg_segment_duration_before,
-            'avg_segment_duration_after': stats.avg_segment_duration_after,
-            'duration_improvement_pct': (
-                100 * (stats.avg_segment_duration_after - stats.avg_segment_duration_before) /
-                stats.avg_segment_duration_before if stats.avg_segment_duration_before > 0 else 0
+        if lazy_stats:
+            diarization_result.metadata['segment_processing']['stats'] = _LazyStats(
+                stats, self._summarize, before, (speaker_ids, durations)
             )
-        }
+        else:
+            diarization_result.metadata['segment_processing']['stats'] = _stats_dict(stats)
         diarization_result.metadata['segment_processing']['config'] = {
             'min_segment_duration': self.config.min_segment_duration,
             'merge_gap_threshold': self.config.merge_gap_threshold,
             'smoothing_window': self.config.smoothing_window
         }
 
-        logger.info(f"Segment processing complete: {stats.original_segment_count} → "
-                   f"{stats.final_segment_count} segments "
-                   f"({100 * (stats.original_segment_count - stats.final_segment_count) / stats.original_segment_count:.1f}% reduction)")
-        logger.info(f"Speaker switches: {stats.speaker_switches_before} → {stats.speaker_switches_after} "
-                   f"({100 * (stats.speaker_switches_before - stats.speaker_switches_after) / stats.speaker_switches_before:.1f}% reduction)")
-        logger.info(f"Avg segment duration: {stats.avg_segment_duration_before:.2f}s → "
-                   f"{stats.avg_segment_duration_after:.2f}s")
+        logger.info("Segment processing complete: %d → %d segments (%.1f%% reduction)",
+                    stats.original_segment_count, stats.final_segment_count,
+                    100 * (stats.original_segment_count - stats.final_segment_count) / stats.original_segment_count)
+        if not lazy_stats:
+            logger.info("Speaker switches: %d → %d (%.1f%% reduction)",
+                        stats.speaker_switches_before, stats.speaker_switches_after,
+                        diarization_result.metadata['segment_processing']['stats']['switch_reduction_pct'])
+            logger.info("Avg segment duration: %.2fs → %.2fs",
+                        stats.avg_segment_duration_before, stats.avg_segment_duration_after)
 
         return diarization_result
 
-    def _filter_micro_segments(self, segments: List[Dict[str, Any]], stats: SegmentProcessingStats) -> List[Dict[str, Any]]:
-        """Filter out micro-segments below minimum duration threshold.
+    def _process_compiled(
+        self, starts: np.ndarray, ends: np.ndarray, speaker_ids: np.ndarray, stats: SegmentProcessingStats
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run filtering, merging and smoothing through the compiled kernel.
 
         Args:
-            segments: List of segment dicts with 'start', 'end', 'duration', 'speaker'
+            starts: Segment start times
+            ends: Segment end times
+            speaker_ids: Integer speaker id per segment
             stats: Statistics object to update
 
         Returns:
-            Filtered list of segments
+            Processed (starts, ends, speaker_ids)
         """
-        filtered = []
-        for seg in segments:
-            if seg['duration'] >= self.config.min_segment_duration:
-                filtered.append(seg)
-            else:
-                stats.micro_segments_removed += 1
-
-        stats.filtered_segment_count = len(filtered)
-        return filtered
-
-    def _merge_consecutive_segments(self, segments: List[Dict[str, Any]], stats: SegmentProcessingStats) -> List[Dict[str, Any]]:
-        """Merge consecutive segments from the same speaker within gap threshold.
+        # A non-positive threshold disables filtering, as on the NumPy path
+        min_segment_duration = self.config.min_segment_duration
+
+        num_segments = len(starts)
+        starts, ends, speaker_ids, counts = process_segments_kernel(
+            starts,
+            ends,
+            speaker_ids,
+            min_segment_duration if min_segment_duration > 0 else -np.inf,
+            self.config.merge_gap_threshold,
+            self.config.smoothing_window,
+        )
+        removed, merged, smoothed = (int(count) for count in counts)
+
+        stats.micro_segments_removed += removed
+        stats.filtered_segment_count = num_segments - removed
+        stats.merged_segment_count += merged
+        stats.smoothed_segment_count += smoothed
+        return starts, ends, speaker_ids
+
+    def _filter_micro_segments(
+        self, starts: np.ndarray, ends: np.ndarray, speaker_ids: np.ndarray, stats: SegmentProcessingStats
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Filter out micro-segments below minimum duration threshold.
 
         Args:
-            segments: List of segment dicts
+            starts: Segment start times
+            ends: Segment end times
+            speaker_ids: Integer speaker id per segment
             stats: Statistics object to update
 
         Returns:
-            Merged list of segments
+            Filtered (starts, ends, speaker_ids)
         """
-        if not segments:
-            return segments
+        keep = (ends - starts) >= self.config.min_segment_duration
+        kept = int(np.count_nonzero(keep))
 
-        merged = []
-        current = segments[0].copy()
+        stats.micro_segments_removed += keep.size - kept
+        stats.filtered_segment_count = kept
+        return starts[keep], ends[keep], speaker_ids[keep]
 
-        for next_seg in segments[1:]:
-            # Check if same speaker and within gap threshold
-            gap = next_seg['start'] - current['end']
-
-            if (next_seg['speaker'] == current['speaker'] and
-                gap <= self.config.merge_gap_threshold):
-                # Merge: extend current segment to include next
-                current['end'] = next_seg['end']
-                current['duration'] = current['end'] - current['start']
-                stats.merged_segment_count += 1
-            else:
-                # Different speaker or gap too large, save current and start new
-                merged.append(current)
-                current = next_seg.copy()
-
-        # Don't forget the last segment
-        merged.append(current)
+    def _merge_consecutive_segments(
+        self, starts: np.ndarray, ends: np.ndarray, speaker_ids: np.ndarray, stats: SegmentProcessingStats
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Merge consecutive segments from the same speaker within gap threshold.
 
-        return merged
+        Args:
+            starts: Segment start times
+            ends: Segment end times
+            speaker_ids: Integer speaker id per segment
+            stats: Statistics object to update
 
-    def _smooth_speaker_transitions(self, segments: List[Dict[str, Any]], stats: SegmentProcessingStats) -> List[Dict[str, Any]]:
+        Returns:
+            Merged (starts, ends, speaker_ids)
+        """
+        if not len(starts):
+            return starts, ends, speaker_ids
+
+        # A new run starts wherever the speaker changes or the gap to the
+        # previous segment is too large; each run collapses to one segment
+        # spanning from its first start to its last end
+        new_run = np.empty(len(starts), dtype=bool)
+        new_run[0] = True
+        new_run[1:] = (speaker_ids[1:] != speaker_ids[:-1]) | (
+            starts[1:] - ends[:-1] > self.config.merge_gap_threshold
+        )
+
+        run_starts, run_ends = _run_bounds(new_run)
+        stats.merged_segment_count += len(starts) - len(run_starts)
+
+        return starts[run_starts], ends[run_ends], speaker_ids[run_starts]
+
+    def _smooth_speaker_transitions(
+        self, starts: np.ndarray, ends: np.ndarray, speaker_ids: np.ndarray, stats: SegmentProcessingStats
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Apply temporal smoothing to reduce ping-pong speaker switches.
 
         If a speaker segment is very short and surrounded by the same different speaker,
         it's likely a misclassification and should be reassigned.
 
         Args:
-            segments: List of segment dicts
+            starts: Segment start times
+            ends: Segment end times
+            speaker_ids: Integer speaker id per segment
             stats: Statistics object to update
 
         Returns:
-            Smoothed list of segments
+            Smoothed (starts, ends, speaker_ids)
         """
-        if len(segments) < 3:
-            return segments
-
-        smoothed = segments.copy()
-
-        # Look for short segments surrounded by the same speaker
-        for i in range(1, len(smoothed) - 1):
-            prev = smoothed[i - 1]
-            curr = smoothed[i]
-            next_seg = smoothed[i + 1]
-
-            # If current is short and surrounded by same speaker (but not current speaker)
-            if (curr['duration'] < self.config.smoothing_window and
-                prev['speaker'] == next_seg['speaker'] and
-                prev['speaker'] != curr['speaker']):
-
-                # Reassign current to surrounding speaker
-                logger.debug(f"Smoothing transition: reassigning segment at {curr['start']:.2f}s "
-                           f"from {curr['speaker']} to {prev['speaker']}")
-                curr['speaker'] = prev['speaker']
-                stats.smoothed_segment_count += 1
+        if len(starts) < 3:
+            return starts, ends, speaker_ids
+
+        # Candidates: short segments whose neighbours share a different speaker
+        candidate = np.zeros(len(starts), dtype=bool)
+        candidate[1:-1] = (
+            ((ends[1:-1] - starts[1:-1]) < self.config.smoothing_window)
+            & (speaker_ids[:-2] == speaker_ids[2:])
+            & (speaker_ids[:-2] != speaker_ids[1:-1])
+        )
+
+        # Reassignment runs left to right, and reassigning a segment gives it the
+        # speaker of the segment after it, which disqualifies that one. So within
+        # each run of consecutive candidates only the 1st, 3rd, 5th... change.
+        index = np.arange(len(starts))
+        run_first = np.maximum.accumulate(np.where(candidate & ~np.r_[False, candidate[:-1]], index, 0))
+        reassigned = np.flatnonzero(candidate & ((index - run_first) % 2 == 0))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for i in reassigned.tolist():
+                logger.debug("Smoothing transition: reassigning segment at %.2fs from speaker %d to %d",
+                             starts[i], speaker_ids[i], speaker_ids[i - 1])
+
+        # Reassign to the surrounding speaker. The arrays are private to
+        # process(), so update in place rather than copying
+        speaker_ids[reassigned] = speaker_ids[reassigned - 1]
+        stats.smoothed_segment_count += len(reassigned)
 
         # After reassignment, we might have created new consecutive same-speaker segments
-        # So merge again
-        merged = []
-        if smoothed:
-            current = smoothed[0].copy()
+        # So merge again (regardless of gap)
+        run_starts, run_ends = _run_bounds(np.r_[True, speaker_ids[1:] != speaker_ids[:-1]])
 
-            for next_seg in smoothed[1:]:
-                if next_seg['speaker'] == current['speaker']:
-                    # Merge adjacent same-speaker segments
-                    current['end'] = next_seg['end']
-                    current['duration'] = current['end'] - current['start']
-                else:
-                    merged.append(current)
-                    current = next_seg.copy()
+        return starts[run_starts], ends[run_ends], speaker_ids[run_starts]
 
-            merged.append(current)
-
-        return merged
-
-    def _count_speaker_switches(self, segments: List[Dict[str, Any]]) -> int:
-        """Count the number of speaker switches in segments.
+    def _summarize(self, speaker_ids: np.ndarray, durations: np.ndarray) -> Tuple[int, float]:
+        """Count speaker switches and average segment duration.
 
         Args:
-            segments: List of segment dicts
+            speaker_ids: Integer speaker id per segment
+            durations: Segment durations
 
         Returns:
-            Number of speaker switches
+            Tuple of (speaker switches, average duration in seconds)
         """
-        if len(segments) < 2:
-            return 0
-
-        switches = 0
-        for i in range(1, len(segments)):
-            if segments[i]['speaker'] != segments[i - 1]['speaker']:
-                switches += 1
+        if not len(durations):
+            return 0, 0.0
 
-        return switches
+        switches = int(np.count_nonzero(speaker_ids[1:] != speaker_ids[:-1]))
+        return switches, float(durations.mean())
 
-    def _calculate_avg_duration(self, segments: List[Dict[str, Any]]) -> float:
-        """Calculate average segment duration.
+    def _calculate_speaker_durations(
+        self, durations: np.ndarray, speaker_ids: np.ndarray, labels: List[str]
+    ) -> Dict[str, float]:
+        """Calculate total speaking time per speaker.
 
         Args:
-            segments: List of segment dicts
+            durations: Segment durations
+            speaker_ids: Integer speaker id per segment
+            labels: Speaker label for each id
 
         Returns:
-            Average duration in seconds
+            Dict mapping speaker ID to total duration, in order of first appearance
         """
-        if not segments:
-            return 0.0
+        totals = np.bincount(speaker_ids, weights=durations, minlength=len(labels)).tolist()
+        present, first_index = np.unique(speaker_ids, return_index=True)
+        return {labels[i]: totals[i] for i in present[np.argsort(first_index)].tolist()}
+
+
+def _stats_dict(stats: SegmentProcessingStats) -> Dict[str, Any]:
+    """Build the metadata stats dict from processing statistics."""
+    return {
+        'original_segment_count': stats.original_segment_count,
+        'final_segment_count': stats.final_segment_count,
+        'micro_segments_removed': stats.micro_segments_removed,
+        'merged_segment_count': stats.merged_segment_count,
+        'smoothed_segment_count': stats.smoothed_segment_count,
+        'speaker_switches_before': stats.speaker_switches_before,
+        'speaker_switches_after': stats.speaker_switches_after,
+        'switch_reduction_pct': (
+            100 * (stats.speaker_switches_before - stats.speaker_switches_after) /
+            stats.speaker_switches_before if stats.speaker_switches_before > 0 else 0
+        ),
+        'avg_segment_duration_before': stats.avg_segment_duration_before,
+        'avg_segment_duration_after': stats.avg_segment_duration_after,
+        'duration_improvement_pct': (
+            100 * (stats.avg_segment_duration_after - stats.avg_segment_duration_before) /
+            stats.avg_segment_duration_before if stats.avg_segment_duration_before > 0 else 0
+        )
+    }
+
+
+def _run_bounds(new_run: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Index of the first and last element of each run.
 
-        total_duration = sum(seg['duration'] for seg in segments)
-        return total_duration / len(segments)
+    Args:
+        new_run: Boolean array marking the elements that start a run; the
+            first element must be True
 
-    def _calculate_speaker_durations(self, segments: List[Dict[str, Any]]) -> Dict[str, float]:
-        """Calculate total speaking time per speaker.
+    Returns:
+        Tuple of (run_starts, run_ends) index arrays
+    """
+    run_starts = np.flatnonzero(new_run)
+    run_ends = np.empty_like(run_starts)
+    run_ends[:-1] = run_starts[1:] - 1
+    run_ends[-1] = len(new_run) - 1
+    return run_starts, run_ends
 
-        Args:
-            segments: List of segment dicts
 
-        Returns:
-            Dict mapping speaker ID to total duration
-        """
-        durations = {}
-        for seg in segments:
-            speaker = seg['speaker']
-            if speaker not in durations:
-                durations[speaker] = 0.0
-            durations[speaker] += seg['duration']
-
-        return durations
+def _to_soa(segments: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """Split segment dicts into parallel arrays.
+
+    Args:
+        segments: List of segment dicts with 'start', 'end' and 'speaker'
+
+    Returns:
+        Tuple of (starts, ends, speaker_ids, labels) where ``labels[i]`` is the
+        speaker label for id ``i``
+    """
+    count = len(segments)
+    ids: Dict[str, int] = {}
+
+    starts = np.fromiter((seg['start'] for seg in segments), dtype=np.float64, count=count)
+    ends = np.fromiter((seg['end'] for seg in segments), dtype=np.float64, count=count)
+    speaker_ids = np.fromiter(
+        (ids.setdefault(seg['speaker'], len(ids)) for seg in segments), dtype=np.int64, count=count
+    )
+    return starts, ends, speaker_ids, list(ids)
+
+
+def _from_soa(
+    starts: np.ndarray, ends: np.ndarray, durations: np.ndarray, speaker_ids: np.ndarray, labels: List[str]
+) -> List[Dict[str, Any]]:
+    """Rebuild segment dicts from parallel arrays (inverse of ``_to_soa``)."""
+    return [
+        {'speaker': labels[speaker_id], 'start': start, 'end': end, 'duration': duration}
+        for start, end, duration, speaker_id in zip(
+            starts.tolist(), ends.tolist(), durations.tolist(), speaker_ids.tolist()
+        )
+    ]
 
 
 def process_segments(diarization_result, config: Optional[SegmentProcessingConfig] = None):
@@ -15,7 +15,12 @@ from dataclasses import dataclass, field
 from pydub import AudioSegment
 
 from ..utils.errors import TranscriptionError, DependencyError, InvalidAudioFormatError
-from ..utils.download import loading_spinner, show_first_run_message, check_model_cached
+from ..utils.download import (
+    loading_spinner,
+    show_first_run_message,
+    check_model_cached,
+    progress_display_enabled,
+)
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -25,6 +30,78 @@ try:
 except ImportError:
     TQDM_AVAILABLE = False
 
+# Loaded Whisper models keyed by (implementation, model size, device/compute
+# type), so processing several files in one process loads each model once
+_MODEL_CACHE: Dict[Tuple[str, ...], Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# openai-whisper installs key/value cache hooks on the shared model's decoder
+# for each decode, so concurrent transcriptions would corrupt each other
+_ORIGINAL_WHISPER_RUN_LOCK = threading.Lock()
+
+
+def _load_cached_model(key: Tuple[str, ...], loader):
+    """Return the cached model for ``key``, calling ``loader`` on first use."""
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            model = loader()
+            _MODEL_CACHE[key] = model
+    return model
+
+
+def clear_model_cache() -> None:
+    """Drop all Whisper models cached by the transcription backends."""
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE.clear()
+
+
+def _faster_whisper_model_spec(model_size: str):
+    """Cache key and loader for a Faster-Whisper model."""
+    import torch
+    from faster_whisper import WhisperModel
+
+    torch_device = "cuda" if torch.cuda.is_available() else "cpu"
+    compute_type = "float16" if torch_device == "cpu" else "float32"
+    return (
+        ("faster", model_size, compute_type),
+        lambda: WhisperModel(model_size, device="cpu", compute_type=compute_type),
+    )
+
+
+def _original_whisper_model_spec(model_size: str):
+    """Cache key and loader for an original OpenAI Whisper model."""
+    import torch
+    import whisper
+
+    device = torch.device('mps') if torch.backends.mps.is_available() else torch.device('cpu')
+    return ("original", model_size, str(device)), lambda: whisper.load_model(model_size, device=device)
+
+
+def preload_model(model_size: str = "base", implementation: str = "auto") -> None:
+    """
+    Load a Whisper model into the model cache ahead of transcription.
+
+    Meant to run in a background thread while other setup work happens; a
+    transcription started meanwhile waits for the load instead of starting
+    its own. MLX-Whisper manages its own models and is not preloaded. Errors
+    are ignored here and surface when transcription loads the model itself.
+
+    Args:
+        model_size: Whisper model size
+        implementation: Whisper implementation (auto, mlx, faster, original)
+    """
+    try:
+        if implementation == "auto":
+            implementation = check_implementations()
+
+        if implementation == "faster":
+            _load_cached_model(*_faster_whisper_model_spec(model_size))
+        elif implementation == "original":
+            _load_cached_model(*_original_whisper_model_spec(model_size))
+    except Exception:
+        pass
+
 
 class ProgressTracker:
     """
@@ -214,8 +291,9 @@ def preprocess_audio(input_file: Path, output_dir: Path) -> Path:
         # Convert to mono and 16kHz
         audio = audio.set_frame_rate(16000).set_channels(1)
 
-        # Export as WAV
-        wav_file = output_dir / f"{base_name}_processed.wav"
+        # Export as WAV (named apart from diarization's copy, which may be
+        # written and removed concurrently in the same directory)
+        wav_file = output_dir / f"{base_name}_processed_whisper.wav"
         audio.export(str(wav_file), format='wav')
 
         return wav_file
@@ -322,9 +400,10 @@ def transcribe_with_mlx(
         estimated_time = audio_duration * model_speeds.get(model_size, 0.1)
         print(f"⏱️  Estimated time: {estimated_time:.1f}s (this may vary)")
 
-        # Start progress tracker
-        progress_tracker = ProgressTracker(estimated_time)
-        progress_tracker.start()
+        # Start progress tracker (worker threads skip the live bar)
+        if progress_display_enabled():
+            progress_tracker = ProgressTracker(estimated_time)
+            progress_tracker.start()
 
     try:
         result = mlx_whisper.transcribe(str(audio_file), path_or_hf_repo=model_repo, language=language)
@@ -363,19 +442,15 @@ def transcribe_with_faster_whisper(
     """Transcribe using Faster-Whisper."""
     try:
         import torch
-        from faster_whisper import WhisperModel
+        model_key, model_loader = _faster_whisper_model_spec(model_size)
     except ImportError:
         raise DependencyError(
             "Faster-Whisper not installed",
             suggestions=["Install with: pip install faster-whisper"],
         )
 
-    # Setup device
-    torch_device = "cuda" if torch.cuda.is_available() else "cpu"
-    compute_type = "float16" if torch_device == "cpu" else "float32"
-
     # Optimize for Apple Silicon CPU
-    if torch_device == "cpu":
+    if not torch.cuda.is_available():
         torch.set_num_threads(8)
 
     # Load model with progress indicator
@@ -383,7 +458,7 @@ def transcribe_with_faster_whisper(
         f"Loading Faster-Whisper {model_size} model...",
         f"Faster-Whisper loaded"
     ):
-        model = WhisperModel(model_size, device="cpu", compute_type=compute_type)
+        model = _load_cached_model(model_key, model_loader)
 
     # Run transcription
     segments_iter, info = model.transcribe(str(audio_file), beam_size=5, language=language)
@@ -395,7 +470,7 @@ def transcribe_with_faster_whisper(
     # Get audio duration for progress bar
     audio_duration = getattr(info, 'duration', 0)
 
-    if audio_duration > 0 and TQDM_AVAILABLE:
+    if audio_duration > 0 and TQDM_AVAILABLE and progress_display_enabled():
         # Show progress bar based on segment timestamps
         print(f"⏳ Transcribing {audio_duration:.1f}s of audio...")
 
@@ -460,23 +535,19 @@ def transcribe_with_original_whisper(
 ) -> Tuple[str, List[Dict[str, Any]], str, float]:
     """Transcribe using Original OpenAI Whisper."""
     try:
-        import whisper
-        import torch
+        model_key, model_loader = _original_whisper_model_spec(model_size)
     except ImportError:
         raise DependencyError(
             "OpenAI Whisper not installed",
             suggestions=["Install with: pip install openai-whisper"],
         )
 
-    # Setup device
-    device = torch.device('mps') if torch.backends.mps.is_available() else torch.device('cpu')
-
     # Load model with progress indicator
     with loading_spinner(
         f"Loading Whisper {model_size} model...",
         f"Whisper loaded"
     ):
-        model = whisper.load_model(model_size, device=device)
+        model = _load_cached_model(model_key, model_loader)
 
     # Get audio duration for progress estimation
     try:
@@ -500,15 +571,17 @@ def transcribe_with_original_whisper(
         estimated_time = audio_duration * model_speeds.get(model_size, 0.2)
         print(f"⏱️  Estimated time: {estimated_time:.1f}s (this may vary)")
 
-        # Start progress tracker
-        progress_tracker = ProgressTracker(estimated_time)
-        progress_tracker.start()
+        # Start progress tracker (worker threads skip the live bar)
+        if progress_display_enabled():
+            progress_tracker = ProgressTracker(estimated_time)
+            progress_tracker.start()
 
-    # Run transcription
+    # Run transcription (one at a time on the shared model)
     try:
-        result = model.transcribe(
-            str(audio_file), language=language, task="transcribe", fp16=False if device.type == 'cpu' else True
-        )
+        with _ORIGINAL_WHISPER_RUN_LOCK:
+            result = model.transcribe(
+                str(audio_file), language=language, task="transcribe", fp16=False if model.device.type == 'cpu' else True
+            )
     finally:
         # Stop progress tracker
         if progress_tracker:
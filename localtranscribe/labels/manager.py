@@ -3,9 +3,11 @@ Speaker label management implementation.
 """
 
 import json
+import os
 import re
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import typer
 from rich.console import Console
@@ -14,6 +16,9 @@ from rich.panel import Panel
 
 console = Console()
 
+# Matches generic speaker IDs (SPEAKER_XX format)
+SPEAKER_ID_PATTERN = re.compile(r"SPEAKER_\d+")
+
 
 class SpeakerLabelManager:
     """
@@ -108,8 +113,7 @@ class SpeakerLabelManager:
             List of unique speaker IDs found
         """
         # Pattern matches SPEAKER_XX format
-        pattern = r"SPEAKER_\d+"
-        speaker_ids = re.findall(pattern, transcript)
+        speaker_ids = SPEAKER_ID_PATTERN.findall(transcript)
 
         # Return unique IDs in sorted order
         return sorted(set(speaker_ids))
@@ -129,19 +133,62 @@ class SpeakerLabelManager:
         Returns:
             Transcript with labels applied
         """
-        result = transcript
+        return self._label_substituter(preserve_original)(transcript)
+
+    def apply_labels_to_file(
+        self,
+        input_path: Path,
+        output_path: Path,
+        preserve_original: bool = False,
+    ) -> List[str]:
+        """
+        Apply speaker labels to a transcript file, streaming it line by line.
 
-        for speaker_id, label in self.labels.items():
-            if preserve_original:
-                replacement = f"{label} ({speaker_id})"
-            else:
-                replacement = label
+        Args:
+            input_path: Transcript file to read
+            output_path: File to write the labeled transcript to
+            preserve_original: If True, keep original IDs in parentheses
+
+        Returns:
+            List of unique speaker IDs found in the input, sorted
+        """
+        substitute = self._label_substituter(preserve_original)
+        speaker_ids = set()
 
-            # Use word boundaries to avoid partial matches
-            pattern = r"\b" + re.escape(speaker_id) + r"\b"
-            result = re.sub(pattern, replacement, result)
+        # Stream into a temporary file and rename it into place, so an
+        # interrupted run never leaves a partially labeled transcript
+        tmp_path = output_path.with_suffix(output_path.suffix + f".tmp{os.getpid()}")
+        with open(input_path, "r", encoding="utf-8") as fin, open(tmp_path, "w", encoding="utf-8") as fout:
+            for line in fin:
+                speaker_ids.update(SPEAKER_ID_PATTERN.findall(line))
+                fout.write(substitute(line))
+        os.replace(tmp_path, output_path)
 
-        return result
+        return sorted(speaker_ids)
+
+    def _label_substituter(self, preserve_original: bool = False) -> Callable[[str], str]:
+        """
+        Build a function that applies every label in a single regex pass.
+
+        Args:
+            preserve_original: If True, keep original IDs in parentheses
+
+        Returns:
+            Function mapping text to labeled text
+        """
+        if not self.labels:
+            return str
+
+        replacements = {
+            speaker_id: f"{label} ({speaker_id})" if preserve_original else label
+            for speaker_id, label in self.labels.items()
+        }
+
+        # Use word boundaries to avoid partial matches; longest IDs first so a
+        # shorter ID never wins over a longer one sharing its prefix
+        alternation = "|".join(re.escape(speaker_id) for speaker_id in sorted(replacements, key=len, reverse=True))
+        pattern = re.compile(r"\b(?:" + alternation + r")\b")
+        return partial(pattern.sub, lambda match: replacements[match.group(0)])
 
     def interactive_label(
         self,
@@ -0,0 +1,121 @@
+"""
+On-disk cache of pipeline stage results.
+
+Entries are keyed by a hash of a stage's input content plus the settings
+that affect it, so re-running the pipeline on the same audio (at any path)
+skips every stage whose inputs have not changed.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..core import DiarizationResult, TranscriptionResult, TranscriptionSegment
+
+CACHE_DIR_NAME = ".lt_cache"
+DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """Hash a file's content, reading it in 1MB chunks."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Directory of cached stage results, one subdirectory per entry.
+
+    The cache is bounded by ``max_bytes``; when a write takes it over the
+    limit, the least recently used entries are removed first.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        """
+        Initialize result cache.
+
+        Args:
+            root: Cache directory (created on first write)
+            max_bytes: Total size above which old entries are evicted
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(audio_digest: str, stage: str, **settings: Any) -> str:
+        """Build the cache key for one stage of one audio file."""
+        payload = json.dumps([audio_digest, stage, settings], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    def load(self, key: str, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached JSON document.
+
+        Returns:
+            The stored document, or None on a miss or an unreadable entry
+        """
+        path = self.root / key / f"{name}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Mark the entry as recently used for eviction
+            os.utime(path.parent)
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def store(self, key: str, name: str, data: Dict[str, Any]) -> None:
+        """Store a JSON document, then evict old entries if over the size limit."""
+        entry_dir = self.root / key
+        entry_dir.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file so readers never see a partial document
+        path = entry_dir / f"{name}.json"
+        tmp_path = path.with_suffix(f".tmp{threading.get_ident()}")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total_bytes = 0
+        for entry in os.scandir(self.root):
+            if not entry.is_dir():
+                continue
+            size = sum(f.stat().st_size for f in os.scandir(entry.path) if f.is_file())
+            entries.append((entry.stat().st_mtime, size, entry.path))
+            total_bytes += size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_bytes -= size
+
+
+def diarization_result_from_dict(data: Dict[str, Any], audio_file: Path) -> DiarizationResult:
+    """Rebuild a cached DiarizationResult for ``audio_file``."""
+    data = dict(data, audio_file=audio_file, output_file=None)
+    return DiarizationResult(**data)
+
+
+def transcription_result_from_dict(data: Dict[str, Any], audio_file: Path) -> TranscriptionResult:
+    """Rebuild a cached TranscriptionResult for ``audio_file``."""
+    segments = [TranscriptionSegment(**segment) for segment in data["segments"]]
+    data = dict(data, audio_file=audio_file, segments=segments, output_files={})
+    return TranscriptionResult(**data)
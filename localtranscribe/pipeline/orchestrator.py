@@ -4,23 +4,20 @@ Pipeline orchestrator that manages the complete transcription workflow.
 Coordinates diarization, transcription, and combination into a single pipeline.
 """
 
+import cProfile
+import functools
+import json
 import os
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 
-try:
-    from rich.console import Console
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-    from rich.panel import Panel
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-
-from dotenv import load_dotenv
-
 from ..core import (
     run_diarization,
     run_transcription,
@@ -30,6 +27,9 @@ from ..core import (
     CombinationResult,
     PathResolver,
 )
+from ..core.combination import map_speakers_to_segments, create_combined_transcript, _speaker_stats
+from ..core.diarization import clear_pipeline_cache, _write_markdown_results
+from ..core.transcription import check_implementations, clear_model_cache, preload_model, _write_output_files
 from ..core.segment_processing import SegmentProcessor, SegmentProcessingConfig
 from ..utils.errors import (
     PipelineError,
@@ -37,6 +37,52 @@ from ..utils.errors import (
     AudioFileNotFoundError,
 )
 from ..utils.file_safety import FileSafetyManager, OverwriteAction
+from .cache import (
+    CACHE_DIR_NAME,
+    DEFAULT_MAX_CACHE_BYTES,
+    ResultCache,
+    hash_file,
+    diarization_result_from_dict,
+    transcription_result_from_dict,
+)
+
+# Serializes console output from concurrent stages and orchestrators, which
+# all write to the same terminal
+_PRINT_LOCK = threading.Lock()
+
+# Rendered stage headings, keyed by title; the set of titles is small and fixed
+_STAGE_BANNERS: Dict[str, Any] = {}
+
+# .env is parsed once per process; load_dotenv never overrides variables
+# that are already set, so repeated loads would not change anything
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_once() -> None:
+    """Load the .env file on first use."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Rich console shared by all orchestrators, created on first use (None without Rich)."""
+    try:
+        from rich.console import Console
+    except ImportError:
+        return None
+    return Console()
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write text to a temporary file and rename it over ``path``, so a killed run never leaves a partial file."""
+    tmp_path = path.with_suffix(path.suffix + f".tmp{os.getpid()}")
+    tmp_path.write_text(text, encoding='utf-8')
+    os.replace(tmp_path, path)
 
 
 class PipelineStage(Enum):
@@ -53,7 +99,11 @@ class PipelineStage(Enum):
     PROOFREADING = "proofreading"
 
 
-@dataclass
+# __slots__ for dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PipelineResult:
     """Complete pipeline execution result."""
 
@@ -67,6 +117,7 @@ class PipelineResult:
     output_files: Dict[str, Path] = field(default_factory=dict)
     error: Optional[str] = None
     error_stage: Optional[str] = None
+    stage_times: Dict[str, float] = field(default_factory=dict)
 
 
 class PipelineOrchestrator:
@@ -76,6 +127,52 @@ class PipelineOrchestrator:
     Manages diarization, transcription, and combination in a single workflow.
     """
 
+    __slots__ = (
+        "audio_file",
+        "output_dir",
+        "model_size",
+        "num_speakers",
+        "min_speakers",
+        "max_speakers",
+        "language",
+        "implementation",
+        "skip_diarization",
+        "output_formats",
+        "verbose",
+        "enable_segment_processing",
+        "segment_processing_config",
+        "use_speaker_regions",
+        "temporal_consistency_weight",
+        "duration_weight",
+        "overlap_weight",
+        "labels_file",
+        "save_labels",
+        "enable_proofreading",
+        "proofreading_rules",
+        "proofreading_level",
+        "enable_audio_analysis",
+        "enable_quality_gates",
+        "quality_report_path",
+        "save_quality_report",  # Optional, set by callers that want the report file
+        "proofreading_domains",
+        "enable_acronym_expansion",
+        "profile",
+        "batch_mode",
+        "parallel_stages",
+        "use_cache",
+        "max_cache_bytes",
+        "console",
+        "file_safety",
+        "path_resolver",
+        "_output_dir_ready",
+        "_output_paths",
+        "_result_cache",
+        "_audio_digest",
+        "hf_token",
+        "stage_results",
+        "stage_times",
+    )
+
     def __init__(
         self,
         audio_file: Path,
@@ -114,6 +211,11 @@ class PipelineOrchestrator:
         quality_report_path: Optional[Path] = None,
         proofreading_domains: Optional[List[str]] = None,
         enable_acronym_expansion: bool = False,
+        profile: bool = False,
+        batch_mode: bool = False,
+        parallel_stages: bool = True,
+        use_cache: bool = False,
+        max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES,
     ):
         """
         Initialize pipeline orchestrator.
@@ -146,6 +248,14 @@ class PipelineOrchestrator:
             enable_proofreading: Enable automatic proofreading
             proofreading_rules: Path to custom proofreading rules file
             proofreading_level: Proofreading level (minimal, standard, thorough)
+            profile: Write a cProfile dump for each stage and a timings JSON to output_dir
+            batch_mode: Print a one-line header instead of the start panel
+                (set by ``run_batch``, which prints one summary for the batch)
+            parallel_stages: Run transcription alongside diarization; disable
+                on memory-constrained machines to load one model at a time
+            use_cache: Reuse stage results for inputs already processed with
+                the same settings (stored in ``output_dir/.lt_cache``)
+            max_cache_bytes: Size above which least recently used cache entries are evicted
         """
         self.audio_file = Path(audio_file)
         self.output_dir = Path(output_dir)
@@ -180,9 +290,14 @@ class PipelineOrchestrator:
         self.quality_report_path = Path(quality_report_path) if quality_report_path else None
         self.proofreading_domains = proofreading_domains or ["common"]
         self.enable_acronym_expansion = enable_acronym_expansion
+        self.profile = profile
+        self.batch_mode = batch_mode
+        self.parallel_stages = parallel_stages
+        self.use_cache = use_cache
+        self.max_cache_bytes = max_cache_bytes
 
         # Setup console for Rich output
-        self.console = Console() if RICH_AVAILABLE else None
+        self.console = _get_console()
 
         # Setup file safety manager
         self.file_safety = FileSafetyManager(
@@ -194,34 +309,192 @@ class PipelineOrchestrator:
 
         # Path resolver
         self.path_resolver = PathResolver(base_dir=base_dir)
+        self._output_dir_ready = False
+        self._output_paths: Optional[Dict[str, Path]] = None
+        self._result_cache: Optional[ResultCache] = None
+        self._audio_digest: Optional[str] = None
 
-        # Load HuggingFace token
-        load_dotenv()
+        # HuggingFace token; .env is only read if validation still needs one
         self.hf_token = hf_token or os.getenv('HUGGINGFACE_TOKEN')
 
         # State tracking
         self.stage_results: Dict[PipelineStage, Any] = {}
         self.stage_times: Dict[PipelineStage, float] = {}
 
+    @classmethod
+    def run_batch(
+        cls, audio_files: List[Path], output_dir: Path, max_workers: int = 1, **kwargs
+    ) -> List[PipelineResult]:
+        """
+        Run the pipeline over several audio files in this process.
+
+        Diarization and Whisper models stay cached between files, so each
+        model is loaded once for the whole batch. Each file gets a one-line
+        header instead of the start panel, and a single summary panel is
+        printed once the batch is done.
+
+        Args:
+            audio_files: Audio files to process, in order
+            output_dir: Directory for all output files
+            max_workers: Files to process concurrently; the cached models are
+                shared between threads. Diarization and original-Whisper
+                transcription still run one file at a time, and worker threads
+                print plain status lines instead of progress bars. Ignored for
+                MLX, which runs one transcription per process at a time
+            **kwargs: Any other ``PipelineOrchestrator`` arguments, applied to every file
+
+        Returns:
+            One PipelineResult per audio file, in input order
+        """
+        kwargs.setdefault("batch_mode", True)
+        orchestrators = [cls(audio_file=audio_file, output_dir=output_dir, **kwargs) for audio_file in audio_files]
+        if not orchestrators:
+            return []
+
+        implementation = kwargs.get("implementation", "auto")
+        if implementation == "auto":
+            implementation = check_implementations()
+
+        batch_start = time.perf_counter()
+        if max_workers > 1 and len(orchestrators) > 1 and implementation != "mlx":
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(cls.run, orchestrators))
+        else:
+            results = [orchestrator.run() for orchestrator in orchestrators]
+        batch_duration = time.perf_counter() - batch_start
+
+        succeeded = sum(1 for result in results if result.success)
+        lines = [
+            f"Files: {len(results)}  ✅ {succeeded}  ❌ {len(results) - succeeded}",
+            f"Total processing time: {batch_duration:.1f}s",
+            f"Output: {output_dir}",
+        ]
+        lines.extend(
+            f"  • {result.audio_file.name}: failed at {result.error_stage}"
+            for result in results
+            if not result.success
+        )
+        orchestrators[-1]._print_panel(
+            "\n".join(lines),
+            title="Batch Complete",
+            style="green" if succeeded == len(results) else "yellow",
+        )
+
+        return results
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Release the diarization and Whisper models cached by previous runs."""
+        clear_pipeline_cache()
+        clear_model_cache()
+
+    def close(self) -> None:
+        """
+        Drop the cached models once this orchestrator is the last user.
+
+        Models are shared by every orchestrator in the process, so only call
+        this when no further files will be processed.
+        """
+        self.clear_cache()
+
     def _print(self, message: str, style: Optional[str] = None):
         """Print message with optional Rich styling."""
-        if self.console:
-            self.console.print(message, style=style)
-        else:
-            print(message)
+        with _PRINT_LOCK:
+            if self.console:
+                self.console.print(message, style=style)
+            else:
+                print(message)
+
+    def _print_lines(self, lines: List[Tuple[str, Optional[str]]]):
+        """Print several (message, style) lines with a single write to the terminal."""
+        with _PRINT_LOCK:
+            if self.console:
+                # The console buffers output inside the context and writes it on exit
+                with self.console:
+                    for message, style in lines:
+                        self.console.print(message, style=style)
+            else:
+                sys.stdout.write("".join(f"{message}\n" for message, _ in lines))
+                sys.stdout.flush()
+
+    def _print_stage_banner(self, title: str, plain_title: Optional[str] = None):
+        """Print a stage heading, parsing its Rich markup only once per process."""
+        with _PRINT_LOCK:
+            if self.console:
+                banner = _STAGE_BANNERS.get(title)
+                if banner is None:
+                    banner = _STAGE_BANNERS[title] = self.console.render_str(f"\n[bold]{title}[/bold]")
+                self.console.print(banner)
+            else:
+                print(f"\n=== {plain_title or title} ===")
 
     def _print_panel(self, message: str, title: Optional[str] = None, style: str = "blue"):
         """Print message in a panel."""
-        if self.console:
-            self.console.print(Panel.fit(message, title=title, border_style=style))
-        else:
-            if title:
-                print(f"\n{'=' * 60}")
-                print(f"{title}")
-                print(f"{'=' * 60}")
-            print(message)
-            if title:
-                print(f"{'=' * 60}\n")
+        with _PRINT_LOCK:
+            if self.console:
+                from rich.panel import Panel
+
+                self.console.print(Panel.fit(message, title=title, border_style=style))
+            else:
+                if title:
+                    print(f"\n{'=' * 60}")
+                    print(f"{title}")
+                    print(f"{'=' * 60}")
+                print(message)
+                if title:
+                    print(f"{'=' * 60}\n")
+
+    def _profiled(self, stage: PipelineStage, fn, *args, **kwargs):
+        """
+        Call a stage function, profiling it when profiling is enabled.
+
+        The profile is written to ``<output_dir>/<audio stem>_<stage>.prof``
+        and can be inspected with ``python -m pstats`` or snakeviz.
+        """
+        if not self.profile:
+            return fn(*args, **kwargs)
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler.disable()
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(self.output_dir / f"{self.audio_file.stem}_{stage.value}.prof"))
+
+    @contextmanager
+    def _time_stage(self, stage: PipelineStage):
+        """Record the wall time of the enclosed block in ``stage_times``, even if it raises."""
+        stage_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_times[stage] = time.perf_counter() - stage_start
+
+    def _discard_abandoned_stages(self, futures: List[Future]) -> None:
+        """Wait for stages still running when the pipeline failed and remove their outputs.
+
+        A worker thread cannot be interrupted, so without this a failed run
+        would return while transcription keeps writing into the output
+        directory (and, in a batch, competes with the next file).
+        """
+        for future in futures:
+            if future.cancelled():
+                continue
+            try:
+                result = future.result()
+            except Exception:
+                continue
+            for path in (getattr(result, 'output_files', None) or {}).values():
+                Path(path).unlink(missing_ok=True)
+
+    def _stage_times_by_name(self) -> Dict[str, float]:
+        """Recorded stage durations keyed by stage name, slowest first."""
+        return {
+            stage.value: seconds
+            for stage, seconds in sorted(self.stage_times.items(), key=lambda item: item[1], reverse=True)
+        }
 
     def validate_prerequisites(self) -> None:
         """
@@ -231,107 +504,182 @@ class PipelineOrchestrator:
             AudioFileNotFoundError: If audio file not found
             HuggingFaceTokenError: If HF token missing (when diarization enabled)
         """
-        stage_start = time.time()
+        with self._time_stage(PipelineStage.VALIDATION):
+            # Resolve audio file path
+            try:
+                self.audio_file = self.path_resolver.resolve_audio_file(self.audio_file)
+                self.path_resolver.validate_audio_file(self.audio_file)
+            except AudioFileNotFoundError:
+                raise
+
+            # Check HuggingFace token if diarization enabled
+            if not self.skip_diarization:
+                if not self.hf_token:
+                    _load_dotenv_once()
+                    self.hf_token = os.getenv('HUGGINGFACE_TOKEN')
+                if not self.hf_token or self.hf_token == "your_token_here":
+                    raise HuggingFaceTokenError(
+                        "HuggingFace token not found or invalid",
+                        suggestions=[
+                            "Add token to .env file: HUGGINGFACE_TOKEN=your_token",
+                            "Get token from: https://huggingface.co/settings/tokens",
+                            "Accept model license at: https://huggingface.co/pyannote/speaker-diarization-3.1",
+                            "Or skip diarization with --skip-diarization flag",
+                        ],
+                        context={'env_file': '.env'},
+                    )
 
-        # Resolve audio file path
-        try:
-            self.audio_file = self.path_resolver.resolve_audio_file(self.audio_file)
-            self.path_resolver.validate_audio_file(self.audio_file)
-        except AudioFileNotFoundError:
-            raise
-
-        # Check HuggingFace token if diarization enabled
-        if not self.skip_diarization:
-            if not self.hf_token or self.hf_token == "your_token_here":
-                raise HuggingFaceTokenError(
-                    "HuggingFace token not found or invalid",
+            # Ensure output directory exists
+            self.output_dir = self.path_resolver.ensure_directory(self.output_dir)
+            self._output_dir_ready = True
+            self._output_paths = None  # Rebuild from the resolved paths
+
+            # Results cache, keyed by the audio content
+            if self.use_cache:
+                self._audio_digest = hash_file(self.audio_file)
+                self._result_cache = ResultCache(self.output_dir / CACHE_DIR_NAME, self.max_cache_bytes)
+
+            # Check for existing output files (only matters when skipping them)
+            existing_files = self._find_existing_outputs() if self.file_safety.skip_existing else []
+            if existing_files:
+                files_list = "\n  • ".join(str(f.name) for f in existing_files)
+                raise PipelineError(
+                    f"Output files already exist:\n  • {files_list}",
                     suggestions=[
-                        "Add token to .env file: HUGGINGFACE_TOKEN=your_token",
-                        "Get token from: https://huggingface.co/settings/tokens",
-                        "Accept model license at: https://huggingface.co/pyannote/speaker-diarization-3.1",
-                        "Or skip diarization with --skip-diarization flag",
+                        "Use --force to overwrite existing files",
+                        "Use --backup to create backups before overwriting",
+                        "Specify a different output directory",
+                        "Rename or move existing files",
                     ],
-                    context={'env_file': '.env'},
+                    context={"existing_files": [str(f) for f in existing_files]},
                 )
 
-        # Ensure output directory exists
-        self.output_dir = self.path_resolver.ensure_directory(self.output_dir)
+            # Now that no check can fail, load the Whisper model in the
+            # background while diarization runs. Skipped when profiling, so the
+            # load shows up in the transcription profile, and with the results
+            # cache, which may make the model unnecessary.
+            if not (self.profile or self.use_cache):
+                threading.Thread(
+                    target=preload_model, args=(self.model_size, self.implementation), daemon=True
+                ).start()
 
-        # Check for existing output files
-        base_name = self.audio_file.stem
+        if self.verbose:
+            self._print("✅ Prerequisites validated", style="green")
+
+    def _get_output_paths(self) -> Dict[str, Path]:
+        """Output file paths for the current audio file, built once."""
+        if self._output_paths is None:
+            stem = self.audio_file.stem
+            self._output_paths = {
+                'diarization': self.output_dir / f"{stem}_diarization.md",
+                'transcript_txt': self.output_dir / f"{stem}_transcript.txt",
+                'transcript_json': self.output_dir / f"{stem}_transcript.json",
+                'transcript_md': self.output_dir / f"{stem}_transcript.md",
+                'combined': self.output_dir / f"{stem}_combined.md",
+                'quality_report': self.output_dir / f"{stem}_quality_report.txt",
+                'timings': self.output_dir / f"{stem}_timings.json",
+            }
+        return self._output_paths
+
+    def _find_existing_outputs(self) -> List[Path]:
+        """List pipeline output files for this audio file that already exist."""
+        paths = self._get_output_paths()
         potential_outputs = [
-            self.output_dir / f"{base_name}_diarization.md",
-            self.output_dir / f"{base_name}_transcript.txt",
-            self.output_dir / f"{base_name}_transcript.json",
-            self.output_dir / f"{base_name}_transcript.md",
-            self.output_dir / f"{base_name}_combined.md",
+            paths['diarization'],
+            paths['transcript_txt'],
+            paths['transcript_json'],
+            paths['transcript_md'],
+            paths['combined'],
         ]
 
-        existing_files = [f for f in potential_outputs if f.exists()]
-        if existing_files and self.file_safety.skip_existing:
-            files_list = "\n  • ".join(str(f.name) for f in existing_files)
-            raise PipelineError(
-                f"Output files already exist:\n  • {files_list}",
-                suggestions=[
-                    "Use --force to overwrite existing files",
-                    "Use --backup to create backups before overwriting",
-                    "Specify a different output directory",
-                    "Rename or move existing files",
-                ],
-                context={"existing_files": [str(f) for f in existing_files]},
-            )
+        # One directory listing instead of a stat call per candidate
+        base_name = self.audio_file.stem
+        with os.scandir(self.output_dir) as entries:
+            present = {entry.name for entry in entries if entry.name.startswith(base_name)}
 
-        self.stage_times[PipelineStage.VALIDATION] = time.time() - stage_start
+        return [path for path in potential_outputs if path.name in present]
 
-        if self.verbose:
-            self._print("✅ Prerequisites validated", style="green")
+    def _load_cached_result(self, stage: PipelineStage, input_file: Optional[Path] = None, **settings):
+        """
+        Look up a cached stage result.
+
+        Args:
+            stage: Stage whose result to look up
+            input_file: File the stage reads (default: the audio file)
+            **settings: Options that affect the stage's output
+
+        Returns:
+            Tuple of (cache key, cached document); the key is None when caching
+            is disabled and the document is None on a miss
+        """
+        if self._result_cache is None:
+            return None, None
+
+        digest = self._audio_digest if input_file is None else hash_file(input_file)
+        key = self._result_cache.key(digest, stage.value, **settings)
+        data = self._result_cache.load(key, stage.value)
+        if data is not None and self.verbose:
+            self._print(f"Using cached {stage.value} result", style="dim")
+        return key, data
 
     def run_diarization_stage(self) -> DiarizationResult:
         """Run speaker diarization stage."""
-        stage_start = time.time()
-
-        self._print("\n[bold]Stage 1/4: Speaker Diarization[/bold]" if self.console else "\n=== Stage 1/4: Speaker Diarization ===")
+        with self._time_stage(PipelineStage.DIARIZATION):
+            self._print_stage_banner("Stage 1/4: Speaker Diarization")
 
-        try:
-            result = run_diarization(
-                audio_file=self.audio_file,
-                hf_token=self.hf_token,
-                output_dir=self.output_dir,
+            cache_key, cached = self._load_cached_result(
+                PipelineStage.DIARIZATION,
                 num_speakers=self.num_speakers,
                 min_speakers=self.min_speakers,
                 max_speakers=self.max_speakers,
             )
-
-            self.stage_times[PipelineStage.DIARIZATION] = time.time() - stage_start
-
-            if self.verbose:
-                self._print(
-                    f"✅ Diarization complete: {result.num_speakers} speakers found ({result.processing_time:.1f}s)",
-                    style="green",
+            if cached is not None:
+                result = diarization_result_from_dict(cached, self.audio_file)
+                result.output_file = _write_markdown_results(
+                    segments=result.segments,
+                    speaker_durations=result.speaker_durations,
+                    audio_file=self.audio_file,
+                    output_dir=self.output_dir,
+                    processing_time=result.processing_time,
+                )
+            else:
+                result = run_diarization(
+                    audio_file=self.audio_file,
+                    hf_token=self.hf_token,
+                    output_dir=self.output_dir,
+                    num_speakers=self.num_speakers,
+                    min_speakers=self.min_speakers,
+                    max_speakers=self.max_speakers,
                 )
+                if cache_key is not None:
+                    self._result_cache.store(cache_key, PipelineStage.DIARIZATION.value, asdict(result))
 
-            return result
+        if self.verbose:
+            self._print(
+                f"✅ Diarization complete: {result.num_speakers} speakers found ({result.processing_time:.1f}s)",
+                style="green",
+            )
 
-        except Exception as e:
-            self.stage_times[PipelineStage.DIARIZATION] = time.time() - stage_start
-            raise
+        return result
 
     def run_segment_processing_stage(self, diarization_result: DiarizationResult) -> DiarizationResult:
         """Run segment post-processing stage to clean and optimize segments."""
-        stage_start = time.time()
-
-        self._print(
-            "\n[bold]Stage 2/4: Segment Post-Processing[/bold]" if self.console else "\n=== Stage 2/4: Segment Post-Processing ==="
-        )
+        # Nothing to merge or smooth with a single segment or a single speaker
+        if len(diarization_result.segments) <= 1 or diarization_result.num_speakers <= 1:
+            self.stage_times[PipelineStage.SEGMENT_PROCESSING] = 0.0
+            if self.verbose:
+                self._print("Skipping segment post-processing: single speaker", style="dim")
+            return diarization_result
 
         try:
-            # Create processor
-            processor = SegmentProcessor(self.segment_processing_config)
+            with self._time_stage(PipelineStage.SEGMENT_PROCESSING):
+                self._print_stage_banner("Stage 2/4: Segment Post-Processing")
 
-            # Process segments
-            processed_result = processor.process(diarization_result)
+                # Create processor
+                processor = SegmentProcessor(self.segment_processing_config)
 
-            self.stage_times[PipelineStage.SEGMENT_PROCESSING] = time.time() - stage_start
+                # Process segments
+                processed_result = processor.process(diarization_result)
 
             if self.verbose:
                 stats = processed_result.metadata.get('segment_processing', {}).get('stats', {})
@@ -347,7 +695,6 @@ class PipelineOrchestrator:
             return processed_result
 
         except Exception as e:
-            self.stage_times[PipelineStage.SEGMENT_PROCESSING] = time.time() - stage_start
             if self.verbose:
                 self._print(f"⚠️  Segment processing failed: {e}", style="yellow")
             # Return original result if processing fails
@@ -355,46 +702,61 @@ class PipelineOrchestrator:
 
     def run_transcription_stage(self) -> TranscriptionResult:
         """Run speech-to-text transcription stage."""
-        stage_start = time.time()
+        with self._time_stage(PipelineStage.TRANSCRIPTION):
+            stage_num = "1/2" if self.skip_diarization else "3/4"
+            self._print_stage_banner(f"Stage {stage_num}: Speech-to-Text Transcription", f"Stage {stage_num}: Transcription")
 
-        stage_num = "1/2" if self.skip_diarization else "3/4"
-        self._print(f"\n[bold]Stage {stage_num}: Speech-to-Text Transcription[/bold]" if self.console else f"\n=== Stage {stage_num}: Transcription ===")
-
-        try:
-            result = run_transcription(
-                audio_file=self.audio_file,
-                output_dir=self.output_dir,
+            cache_key, cached = self._load_cached_result(
+                PipelineStage.TRANSCRIPTION,
                 model_size=self.model_size,
                 language=self.language,
                 implementation=self.implementation,
-                output_formats=self.output_formats,
             )
-
-            self.stage_times[PipelineStage.TRANSCRIPTION] = time.time() - stage_start
-
-            if self.verbose:
-                self._print(
-                    f"✅ Transcription complete: {result.language} detected ({result.processing_time:.1f}s)",
-                    style="green",
+            if cached is not None:
+                result = transcription_result_from_dict(cached, self.audio_file)
+                result.output_files = _write_output_files(
+                    text=result.text,
+                    segments=result.segments,
+                    audio_file=self.audio_file,
+                    output_dir=self.output_dir,
+                    language=result.language,
+                    duration=result.duration,
+                    formats=self.output_formats,
+                )
+            else:
+                result = run_transcription(
+                    audio_file=self.audio_file,
+                    output_dir=self.output_dir,
+                    model_size=self.model_size,
+                    language=self.language,
+                    implementation=self.implementation,
+                    output_formats=self.output_formats,
                 )
+                if cache_key is not None:
+                    self._result_cache.store(cache_key, PipelineStage.TRANSCRIPTION.value, asdict(result))
 
-            return result
+        if self.verbose:
+            self._print(
+                f"✅ Transcription complete: {result.language} detected ({result.processing_time:.1f}s)",
+                style="green",
+            )
 
-        except Exception as e:
-            self.stage_times[PipelineStage.TRANSCRIPTION] = time.time() - stage_start
-            raise
+        return result
 
     def run_combination_stage(
         self, diarization_result: DiarizationResult, transcription_result: TranscriptionResult
     ) -> CombinationResult:
         """Run combination stage to merge diarization and transcription."""
-        stage_start = time.time()
-
-        self._print("\n[bold]Stage 4/4: Combining Results[/bold]" if self.console else "\n=== Stage 4/4: Combining Results ===")
-
-        try:
-            # Import the enhanced mapping function
-            from ..core.combination import map_speakers_to_segments
+        with self._time_stage(PipelineStage.COMBINATION):
+            self._print_stage_banner("Stage 4/4: Combining Results")
+
+            # Speaker regions shorter than min_region_duration are folded into
+            # a neighbouring region before scoring (opt-in, off by default)
+            min_region_duration = (
+                self.segment_processing_config.min_region_duration
+                if self.enable_segment_processing and self.segment_processing_config.enabled
+                else 0.0
+            )
 
             # Use enhanced speaker mapping with context-aware scoring
             enhanced_segments = map_speakers_to_segments(
@@ -404,33 +766,32 @@ class PipelineOrchestrator:
                 temporal_consistency_weight=self.temporal_consistency_weight,
                 duration_weight=self.duration_weight,
                 overlap_weight=self.overlap_weight,
+                min_region_duration=min_region_duration,
             )
 
-            # Calculate speaker durations from enhanced segments
-            speaker_durations = {}
-            for seg in enhanced_segments:
-                if seg.speaker not in speaker_durations:
-                    speaker_durations[seg.speaker] = 0
-                speaker_durations[seg.speaker] += seg.end - seg.start
+            # Per-speaker totals in one pass, shared with the transcript's
+            # speaking-time section
+            stats = _speaker_stats(enhanced_segments)
+            speaker_durations = stats[0]
 
             # Create combined transcript
-            from ..core.combination import create_combined_transcript, CombinationResult
-
             transcript_text = create_combined_transcript(
-                enhanced_segments, transcription_result.audio_file, include_confidence=True
+                enhanced_segments, transcription_result.audio_file, include_confidence=True, stats=stats
             )
 
             # Save to file
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-            output_file = self.output_dir / f"{transcription_result.audio_file.stem}_combined.md"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(transcript_text)
+            audio_file = transcription_result.audio_file
+            if not self._output_dir_ready:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                self._output_dir_ready = True
+            output_file = self._get_output_paths()['combined']
+            _atomic_write_text(output_file, transcript_text)
 
             result = CombinationResult(
                 success=True,
-                audio_file=transcription_result.audio_file,
+                audio_file=audio_file,
                 segments=enhanced_segments,
-                num_speakers=len(set(seg.speaker for seg in enhanced_segments)),
+                num_speakers=len(speaker_durations),
                 speaker_durations=speaker_durations,
                 output_file=output_file,
                 metadata={
@@ -442,33 +803,26 @@ class PipelineOrchestrator:
                         'temporal_consistency_weight': self.temporal_consistency_weight,
                         'duration_weight': self.duration_weight,
                         'overlap_weight': self.overlap_weight,
+                        'min_region_duration': min_region_duration,
                     },
                 },
             )
 
-            self.stage_times[PipelineStage.COMBINATION] = time.time() - stage_start
-
-            if self.verbose:
-                self._print(
-                    f"✅ Combination complete: {result.num_speakers} speakers mapped to {len(result.segments)} segments",
-                    style="green",
-                )
-
-            return result
+        if self.verbose:
+            self._print(
+                f"✅ Combination complete: {result.num_speakers} speakers mapped to {len(result.segments)} segments",
+                style="green",
+            )
 
-        except Exception as e:
-            self.stage_times[PipelineStage.COMBINATION] = time.time() - stage_start
-            raise
+        return result
 
     def run_labeling_stage(self, output_file: Path) -> Path:
         """Run speaker labeling stage to replace speaker IDs with names."""
         from ..labels import SpeakerLabelManager
 
-        stage_start = time.time()
-
-        self._print("\n[bold]Speaker Labeling[/bold]" if self.console else "\n=== Speaker Labeling ===")
+        with self._time_stage(PipelineStage.LABELING):
+            self._print_stage_banner("Speaker Labeling")
 
-        try:
             # Initialize label manager
             manager = SpeakerLabelManager()
 
@@ -478,75 +832,100 @@ class PipelineOrchestrator:
                 if self.verbose:
                     self._print(f"Loaded labels from: {self.labels_file}", style="cyan")
 
-            # Read the output file
-            with open(output_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Detect speakers if saving labels
-            if self.save_labels:
-                speakers = manager.detect_speakers(content)
-                if self.verbose:
-                    self._print(f"Detected {len(speakers)} speakers", style="cyan")
-
-            # Apply labels
-            labeled_content = manager.apply_labels(content)
-
-            # Save labeled version
+            # Apply labels, streaming the transcript into the labeled version
             labeled_file = output_file.with_stem(output_file.stem + "_labeled")
-            with open(labeled_file, "w", encoding="utf-8") as f:
-                f.write(labeled_content)
+            cache_key, cached = self._load_cached_result(PipelineStage.LABELING, output_file, labels=manager.labels)
+            if cached is not None:
+                _atomic_write_text(labeled_file, cached['text'])
+                speakers = cached['speakers']
+            else:
+                speakers = manager.apply_labels_to_file(output_file, labeled_file)
+                if cache_key is not None:
+                    self._result_cache.store(
+                        cache_key,
+                        PipelineStage.LABELING.value,
+                        {'text': labeled_file.read_text(encoding='utf-8'), 'speakers': speakers},
+                    )
+
+            if self.save_labels and self.verbose:
+                self._print(f"Detected {len(speakers)} speakers", style="cyan")
 
             # Save label mappings if requested
             if self.save_labels and manager.labels:
                 manager.save_labels(self.save_labels)
 
-            self.stage_times[PipelineStage.LABELING] = time.time() - stage_start
-
-            if self.verbose:
-                self._print(
-                    f"✅ Labeling complete: Applied {len(manager.labels)} speaker labels ({time.time() - stage_start:.1f}s)",
-                    style="green",
-                )
-
-            return labeled_file
+        if self.verbose:
+            self._print(
+                f"✅ Labeling complete: Applied {len(manager.labels)} speaker labels ({self.stage_times[PipelineStage.LABELING]:.1f}s)",
+                style="green",
+            )
 
-        except Exception as e:
-            self.stage_times[PipelineStage.LABELING] = time.time() - stage_start
-            raise
+        return labeled_file
 
     def run_proofreading_stage(self, input_file: Path) -> Path:
         """Run proofreading stage to fix common transcription errors."""
-        from ..proofreading import Proofreader, ProofreadingLevel
-
-        stage_start = time.time()
-
-        self._print("\n[bold]Proofreading Transcript[/bold]" if self.console else "\n=== Proofreading ===")
+        from ..proofreading import ProofreadingLevel, get_cached_proofreader
 
         try:
-            # Initialize proofreader with Phase 2 enhancements
-            proofreader = Proofreader(
-                level=ProofreadingLevel(self.proofreading_level),
-                track_changes=self.verbose,
-                verbose=self.verbose,
-                enable_domain_dictionaries=bool(self.proofreading_domains),
-                domains=self.proofreading_domains,
-                enable_acronym_expansion=self.enable_acronym_expansion
-            )
-
-            # Load custom rules if provided
-            if self.proofreading_rules and self.proofreading_rules.exists():
-                proofreader.load_rules_from_file(self.proofreading_rules)
-                if self.verbose:
-                    self._print(f"Loaded custom rules from: {self.proofreading_rules}", style="cyan")
-
-            # Proofread the file
-            result = proofreader.proofread_file(
-                input_path=input_file,
-                output_path=None,  # Will create _proofread version
-                create_backup=False
-            )
-
-            self.stage_times[PipelineStage.PROOFREADING] = time.time() - stage_start
+            with self._time_stage(PipelineStage.PROOFREADING):
+                self._print_stage_banner("Proofreading Transcript", "Proofreading")
+
+                # Unchanged input, rules and settings give the same corrections
+                rules_digest = None
+                if self._result_cache is not None and self.proofreading_rules and self.proofreading_rules.exists():
+                    rules_digest = hash_file(self.proofreading_rules)
+                cache_key, cached = self._load_cached_result(
+                    PipelineStage.PROOFREADING,
+                    input_file,
+                    level=self.proofreading_level,
+                    domains=self.proofreading_domains,
+                    acronym_expansion=self.enable_acronym_expansion,
+                    rules=rules_digest,
+                )
+                if cached is not None:
+                    if cached['corrected_text'] is None:
+                        if self.verbose:
+                            self._print("✅ Proofreading complete: No corrections needed", style="green")
+                        return input_file
+
+                    output_file = input_file.with_stem(input_file.stem + "_proofread")
+                    _atomic_write_text(output_file, cached['corrected_text'])
+                    if self.verbose:
+                        self._print(
+                            f"✅ Proofreading complete: {cached['total_changes']} corrections made (cached)",
+                            style="green",
+                        )
+                    return output_file
+
+                # Reuse the proofreader from an earlier file when settings and rules match
+                rules_path = self.proofreading_rules if self.proofreading_rules and self.proofreading_rules.exists() else None
+                proofreader = get_cached_proofreader(
+                    rules_path=rules_path,
+                    level=ProofreadingLevel(self.proofreading_level),
+                    track_changes=self.verbose,
+                    verbose=self.verbose,
+                    enable_domain_dictionaries=bool(self.proofreading_domains),
+                    domains=self.proofreading_domains,
+                    enable_acronym_expansion=self.enable_acronym_expansion
+                )
+                if rules_path and self.verbose:
+                    self._print(f"Loaded custom rules from: {rules_path}", style="cyan")
+
+                # Proofread the file
+                result = proofreader.proofread_file(
+                    input_path=input_file,
+                    output_path=None,  # Will create _proofread version
+                    create_backup=False
+                )
+                if cache_key is not None and result.success:
+                    self._result_cache.store(
+                        cache_key,
+                        PipelineStage.PROOFREADING.value,
+                        {
+                            'corrected_text': result.corrected_text if result.has_changes else None,
+                            'total_changes': result.total_changes,
+                        },
+                    )
 
             if result.success and result.has_changes:
                 output_file = input_file.with_stem(input_file.stem + "_proofread")
@@ -565,7 +944,6 @@ class PipelineOrchestrator:
                 return input_file
 
         except Exception as e:
-            self.stage_times[PipelineStage.PROOFREADING] = time.time() - stage_start
             if self.verbose:
                 self._print(f"⚠️  Proofreading failed: {e}", style="yellow")
             # Return original file if proofreading fails
@@ -575,15 +953,12 @@ class PipelineOrchestrator:
         """Run audio analysis stage (Phase 2)."""
         from ..audio import AudioAnalyzer
 
-        stage_start = time.time()
-
-        self._print("\n[bold]Audio Quality Analysis[/bold]" if self.console else "\n=== Audio Analysis ===")
-
         try:
-            analyzer = AudioAnalyzer(verbose=self.verbose)
-            analysis_result = analyzer.analyze(self.audio_file)
+            with self._time_stage(PipelineStage.AUDIO_ANALYSIS):
+                self._print_stage_banner("Audio Quality Analysis", "Audio Analysis")
 
-            self.stage_times[PipelineStage.AUDIO_ANALYSIS] = time.time() - stage_start
+                analyzer = AudioAnalyzer(verbose=self.verbose)
+                analysis_result = analyzer.analyze(self.audio_file)
 
             if self.verbose:
                 self._print(
@@ -597,7 +972,6 @@ class PipelineOrchestrator:
             return analysis_result
 
         except Exception as e:
-            self.stage_times[PipelineStage.AUDIO_ANALYSIS] = time.time() - stage_start
             if self.verbose:
                 self._print(f"⚠️  Audio analysis failed: {e}", style="yellow")
             return None
@@ -609,58 +983,58 @@ class PipelineOrchestrator:
         combination_result=None
     ):
         """Run quality assessment for completed stages (Phase 2)."""
-        from ..quality import QualityGate
-
-        stage_start = time.time()
+        # Nothing to assess: skip the quality module import and stage output
+        if diarization_result is None and transcription_result is None and combination_result is None:
+            return {}
 
-        self._print("\n[bold]Quality Assessment[/bold]" if self.console else "\n=== Quality Assessment ===")
+        from ..quality import QualityGate
 
         try:
-            gate = QualityGate(verbose=self.verbose)
-            assessments = {}
+            with self._time_stage(PipelineStage.QUALITY_ASSESSMENT):
+                self._print_stage_banner("Quality Assessment")
 
-            # Assess diarization if available
-            if diarization_result:
-                dia_assessment = gate.assess_diarization_quality(diarization_result)
-                assessments['diarization'] = dia_assessment
+                gate = QualityGate(verbose=self.verbose)
+                assessments = {}
 
-                if self.verbose:
-                    status = "✅" if dia_assessment.passed else "⚠️"
-                    self._print(
-                        f"{status} Diarization quality: {dia_assessment.overall_score:.2f}",
-                        style="green" if dia_assessment.passed else "yellow"
-                    )
+                # Assess diarization if available
+                if diarization_result:
+                    dia_assessment = gate.assess_diarization_quality(diarization_result)
+                    assessments['diarization'] = dia_assessment
 
-            # Assess transcription if available
-            if transcription_result:
-                trans_assessment = gate.assess_transcription_quality(transcription_result)
-                assessments['transcription'] = trans_assessment
+                    if self.verbose:
+                        status = "✅" if dia_assessment.passed else "⚠️"
+                        self._print(
+                            f"{status} Diarization quality: {dia_assessment.overall_score:.2f}",
+                            style="green" if dia_assessment.passed else "yellow"
+                        )
 
-                if self.verbose:
-                    status = "✅" if trans_assessment.passed else "⚠️"
-                    self._print(
-                        f"{status} Transcription quality: {trans_assessment.overall_score:.2f}",
-                        style="green" if trans_assessment.passed else "yellow"
-                    )
+                # Assess transcription if available
+                if transcription_result:
+                    trans_assessment = gate.assess_transcription_quality(transcription_result)
+                    assessments['transcription'] = trans_assessment
 
-            # Assess combination if available
-            if combination_result:
-                comb_assessment = gate.assess_combination_quality(combination_result)
-                assessments['combination'] = comb_assessment
+                    if self.verbose:
+                        status = "✅" if trans_assessment.passed else "⚠️"
+                        self._print(
+                            f"{status} Transcription quality: {trans_assessment.overall_score:.2f}",
+                            style="green" if trans_assessment.passed else "yellow"
+                        )
 
-                if self.verbose:
-                    status = "✅" if comb_assessment.passed else "⚠️"
-                    self._print(
-                        f"{status} Speaker mapping quality: {comb_assessment.overall_score:.2f}",
-                        style="green" if comb_assessment.passed else "yellow"
-                    )
+                # Assess combination if available
+                if combination_result:
+                    comb_assessment = gate.assess_combination_quality(combination_result)
+                    assessments['combination'] = comb_assessment
 
-            self.stage_times[PipelineStage.QUALITY_ASSESSMENT] = time.time() - stage_start
+                    if self.verbose:
+                        status = "✅" if comb_assessment.passed else "⚠️"
+                        self._print(
+                            f"{status} Speaker mapping quality: {comb_assessment.overall_score:.2f}",
+                            style="green" if comb_assessment.passed else "yellow"
+                        )
 
             return assessments
 
         except Exception as e:
-            self.stage_times[PipelineStage.QUALITY_ASSESSMENT] = time.time() - stage_start
             if self.verbose:
                 self._print(f"⚠️  Quality assessment failed: {e}", style="yellow")
             return {}
@@ -672,54 +1046,101 @@ class PipelineOrchestrator:
         Returns:
             PipelineResult with all stage results and output files
         """
-        total_start = time.time()
+        total_start = time.perf_counter()
         stages_completed = []
+        abandoned: List[Future] = []
 
         # Print header
-        self._print_panel(
-            f"🎙️ LocalTranscribe Pipeline\n\nAudio: {self.audio_file.name}\nOutput: {self.output_dir}",
-            title="Pipeline Started",
-            style="blue",
-        )
+        if self.batch_mode:
+            self._print(f"\n▶ {self.audio_file.name}", style="bold blue")
+        else:
+            self._print_panel(
+                f"🎙️ LocalTranscribe Pipeline\n\nAudio: {self.audio_file.name}\nOutput: {self.output_dir}",
+                title="Pipeline Started",
+                style="blue",
+            )
 
         try:
             # Stage 0: Validation
             if self.verbose:
                 self._print("\n[bold]Validating prerequisites...[/bold]" if self.console else "\nValidating prerequisites...")
-            self.validate_prerequisites()
+            self._profiled(PipelineStage.VALIDATION, self.validate_prerequisites)
             stages_completed.append("validation")
 
             # Stage 0.5: Audio Analysis (Phase 2 - optional)
+            # Analysis and transcription only read the audio file, so they run
+            # in worker threads alongside diarization; combination is the
+            # first stage that needs both results
             audio_analysis_result = None
-            if self.enable_audio_analysis and not self.skip_diarization:
-                audio_analysis_result = self.run_audio_analysis_stage()
-                stages_completed.append("audio_analysis")
-
-            # Stage 1: Diarization (optional)
             diarization_result = None
-            if not self.skip_diarization:
-                diarization_result = self.run_diarization_stage()
-                stages_completed.append("diarization")
-
-                # Stage 2: Segment Processing (Phase 1 enhancement)
-                if self.enable_segment_processing:
-                    diarization_result = self.run_segment_processing_stage(diarization_result)
-                    stages_completed.append("segment_processing")
-
-            # Stage 3: Transcription
-            transcription_result = self.run_transcription_stage()
-            stages_completed.append("transcription")
+            executor = ThreadPoolExecutor(max_workers=2)
+            audio_analysis_future = None
+            transcription_future = None
+            try:
+                if self.enable_audio_analysis and not self.skip_diarization:
+                    if self.profile:
+                        # cProfile follows one thread at a time, so profiled
+                        # runs analyse the audio before diarization instead
+                        audio_analysis_result = self._profiled(
+                            PipelineStage.AUDIO_ANALYSIS, self.run_audio_analysis_stage
+                        )
+                        stages_completed.append("audio_analysis")
+                    else:
+                        audio_analysis_future = executor.submit(self.run_audio_analysis_stage)
+
+                # Stage 3: Transcription, started early when running in parallel
+                if self.parallel_stages and not self.profile and not self.skip_diarization:
+                    transcription_future = executor.submit(self.run_transcription_stage)
+
+                # Stage 1: Diarization (optional)
+                if not self.skip_diarization:
+                    diarization_result = self._profiled(PipelineStage.DIARIZATION, self.run_diarization_stage)
+
+                if audio_analysis_future is not None:
+                    audio_analysis_result = audio_analysis_future.result()
+                    stages_completed.append("audio_analysis")
+
+                if not self.skip_diarization:
+                    stages_completed.append("diarization")
+
+                    # Stage 2: Segment Processing (Phase 1 enhancement)
+                    if self.enable_segment_processing:
+                        diarization_result = self._profiled(
+                            PipelineStage.SEGMENT_PROCESSING, self.run_segment_processing_stage, diarization_result
+                        )
+                        stages_completed.append("segment_processing")
+
+                # Stage 3: Transcription
+                if transcription_future is not None:
+                    transcription_result = transcription_future.result()
+                else:
+                    transcription_result = self._profiled(PipelineStage.TRANSCRIPTION, self.run_transcription_stage)
+                stages_completed.append("transcription")
+            except BaseException:
+                # Report the failure now rather than after the other stages
+                # finish; stages already running are discarded before returning
+                abandoned = [
+                    future for future in (audio_analysis_future, transcription_future)
+                    if future is not None and not future.done()
+                ]
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
 
             # Stage 4: Combination (only if diarization was done)
             combination_result = None
             if not self.skip_diarization:
-                combination_result = self.run_combination_stage(diarization_result, transcription_result)
+                combination_result = self._profiled(
+                    PipelineStage.COMBINATION, self.run_combination_stage, diarization_result, transcription_result
+                )
                 stages_completed.append("combination")
 
             # Stage 4.5: Quality Assessment (Phase 2 - optional)
             quality_assessments = {}
             if self.enable_quality_gates:
-                quality_assessments = self.run_quality_assessment_stage(
+                quality_assessments = self._profiled(
+                    PipelineStage.QUALITY_ASSESSMENT,
+                    self.run_quality_assessment_stage,
                     diarization_result=diarization_result,
                     transcription_result=transcription_result,
                     combination_result=combination_result
@@ -735,18 +1156,20 @@ class PipelineOrchestrator:
 
             # Stage 4: Speaker Labeling (optional)
             if self.labels_file and main_output_file:
-                labeled_file = self.run_labeling_stage(main_output_file)
+                labeled_file = self._profiled(PipelineStage.LABELING, self.run_labeling_stage, main_output_file)
                 stages_completed.append("labeling")
                 main_output_file = labeled_file  # Update for proofreading
 
             # Stage 5: Proofreading (optional)
             final_output_file = main_output_file
             if self.enable_proofreading and main_output_file:
-                final_output_file = self.run_proofreading_stage(main_output_file)
+                final_output_file = self._profiled(
+                    PipelineStage.PROOFREADING, self.run_proofreading_stage, main_output_file
+                )
                 stages_completed.append("proofreading")
 
             # Calculate total time
-            total_duration = time.time() - total_start
+            total_duration = time.perf_counter() - total_start
 
             # Collect output files
             output_files = {}
@@ -757,8 +1180,11 @@ class PipelineOrchestrator:
             if combination_result and combination_result.output_file:
                 output_files['combined'] = combination_result.output_file
 
-            # Add final processed file if different from combined
-            if final_output_file and final_output_file != combination_result.output_file if combination_result else None:
+            # Add final processed file if labeling or proofreading produced one
+            unprocessed_output = (
+                combination_result.output_file if combination_result else transcription_result.output_files.get("md")
+            )
+            if final_output_file and final_output_file != unprocessed_output:
                 output_files['final'] = final_output_file
 
             # Generate quality report (Phase 2)
@@ -773,9 +1199,8 @@ class PipelineOrchestrator:
 
                 # Save quality report if requested
                 if self.quality_report_path or (hasattr(self, 'save_quality_report') and self.save_quality_report):
-                    report_path = self.quality_report_path or self.output_dir / f"{self.audio_file.stem}_quality_report.txt"
-                    with open(report_path, 'w', encoding='utf-8') as f:
-                        f.write(quality_report)
+                    report_path = self.quality_report_path or self._get_output_paths()['quality_report']
+                    _atomic_write_text(report_path, quality_report)
                     output_files['quality_report'] = report_path
 
                     if self.verbose:
@@ -784,14 +1209,29 @@ class PipelineOrchestrator:
                     # Print quality report to console
                     self._print("\n" + quality_report, style="dim")
 
+            # Stage timings, slowest first; profiled runs also get a JSON sidecar
+            stage_times = self._stage_times_by_name()
+            if self.profile:
+                timings_path = self._get_output_paths()['timings']
+                _atomic_write_text(
+                    timings_path, json.dumps({'total': total_duration, 'stages': stage_times}, indent=2)
+                )
+                output_files['timings'] = timings_path
+
             # Print success summary
-            self._print("\n" + "=" * 60, style="green")
-            self._print("✅ Pipeline completed successfully!", style="bold green")
-            self._print(f"Total processing time: {total_duration:.1f}s", style="green")
-            self._print(f"\nOutput files in: {self.output_dir}", style="cyan")
-            for key, path in output_files.items():
-                self._print(f"  • {key}: {path.name}", style="cyan")
-            self._print("=" * 60, style="green")
+            summary = [
+                ("\n" + "=" * 60, "green"),
+                ("✅ Pipeline completed successfully!", "bold green"),
+                (f"Total processing time: {total_duration:.1f}s", "green"),
+            ]
+            summary.extend(
+                (f"  {stage}: {seconds:.1f}s ({seconds / total_duration:.0%})", "dim")
+                for stage, seconds in stage_times.items()
+            )
+            summary.append((f"\nOutput files in: {self.output_dir}", "cyan"))
+            summary.extend((f"  • {key}: {path.name}", "cyan") for key, path in output_files.items())
+            summary.append(("=" * 60, "green"))
+            self._print_lines(summary)
 
             return PipelineResult(
                 success=True,
@@ -802,19 +1242,23 @@ class PipelineOrchestrator:
                 transcription_result=transcription_result,
                 combination_result=combination_result,
                 output_files=output_files,
+                stage_times=stage_times,
             )
 
         except Exception as e:
             # Determine which stage failed
             error_stage = stages_completed[-1] if stages_completed else "validation"
 
-            total_duration = time.time() - total_start
+            total_duration = time.perf_counter() - total_start
 
             # Print error
-            self._print("\n" + "=" * 60, style="red")
-            self._print(f"❌ Pipeline failed at stage: {error_stage}", style="bold red")
-            self._print(f"Error: {str(e)}", style="red")
-            self._print("=" * 60, style="red")
+            self._print_lines([
+                ("\n" + "=" * 60, "red"),
+                (f"❌ Pipeline failed at stage: {error_stage}", "bold red"),
+                (f"Error: {str(e)}", "red"),
+                ("=" * 60, "red"),
+            ])
+            self._discard_abandoned_stages(abandoned)
 
             return PipelineResult(
                 success=False,
@@ -823,4 +1267,5 @@ class PipelineOrchestrator:
                 stages_completed=stages_completed,
                 error=str(e),
                 error_stage=error_stage,
+                stage_times=self._stage_times_by_name(),
             )
@@ -9,7 +9,8 @@ from .proofreader import (
     Proofreader,
     ProofreadingLevel,
     ProofreadingResult,
-    ProofreadingChange
+    ProofreadingChange,
+    get_cached_proofreader
 )
 from .rules import (
     RuleManager,
@@ -40,6 +41,7 @@ __all__ = [
     "ProofreadingLevel",
     "ProofreadingResult",
     "ProofreadingChange",
+    "get_cached_proofreader",
 
     # Rule management
     "RuleManager",
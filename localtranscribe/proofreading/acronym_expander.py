@@ -5,8 +5,9 @@ Provides intelligent context-aware acronym expansion with disambiguation
 using spaCy NER and context analysis.
 """
 
+import functools
 import re
-from typing import Dict, Optional, List, Tuple, Any
+from typing import Dict, FrozenSet, Iterator, Optional, List, Tuple, Any
 import warnings
 
 try:
@@ -23,6 +24,13 @@ try:
 except ImportError:
     ContextAwareMatcher = None
 
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 
 # Common acronyms and their expansions (100+ definitions)
 ACRONYM_DATABASE: Dict[str, List[str]] = {
@@ -225,6 +233,31 @@ ACRONYM_DATABASE: Dict[str, List[str]] = {
 }
 
 
+# Runs of word characters. An acronym made only of word characters occurs
+# as a whole word exactly when it is one of the runs in the text
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Alternations at least this wide are compiled with RE2 when installed; its
+# DFA matches them in linear time, while re tries each branch in turn
+_RE2_MIN_ACRONYMS = 50
+
+
+@functools.lru_cache(maxsize=256)
+def _build_acronym_pattern(acronyms: FrozenSet[str]) -> re.Pattern:
+    """
+    Compile one regex matching any of the given acronyms as a whole word.
+
+    Longest acronyms come first in the alternation, so "CI/CD" wins over
+    "CI" at the same position. Patterns are cached by acronym set, so
+    texts mentioning the same acronyms share one compiled pattern.
+    """
+    alternation = "|".join(re.escape(acronym) for acronym in sorted(acronyms, key=len, reverse=True))
+    pattern = r"\b(?:" + alternation + r")\b"
+    if RE2_AVAILABLE and len(acronyms) >= _RE2_MIN_ACRONYMS:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
+
 class AcronymExpander:
     """
     Basic acronym expansion without context awareness.
@@ -250,6 +283,11 @@ class AcronymExpander:
         self.acronym_db = ACRONYM_DATABASE.copy()
         if custom_acronyms:
             self.acronym_db.update(custom_acronyms)
+        # Acronyms containing non-word characters (e.g. R&D), mapped to their
+        # word parts; built on first use (see _find_acronyms)
+        self._compound_acronyms: Optional[Dict[str, FrozenSet[str]]] = None
+        # Uppercased acronym -> database key, for case-insensitive lookups
+        self._upper_index = {acronym.upper(): acronym for acronym in self.acronym_db}
 
         self.expand_all = expand_all
         self.first_occurrence_only = first_occurrence_only
@@ -270,49 +308,50 @@ class AcronymExpander:
         Returns:
             Text with expanded acronyms
         """
-        result = text
-
-        for acronym, expansions in self.acronym_db.items():
-            # Skip if we've already expanded this acronym and only doing first occurrence
-            if self.first_occurrence_only and acronym in self.expanded_acronyms:
-                continue
-
-            # Find all occurrences of the acronym
-            pattern = r'\b' + re.escape(acronym) + r'\b'
-            matches = list(re.finditer(pattern, result))
-
-            if not matches:
+        # Acronyms expanded by an earlier call are neither expanded nor counted again
+        skipped = set(self.expanded_acronyms) if self.first_occurrence_only else set()
+        first_only = self.first_occurrence_only or not self.expand_all
+        replaced = set()
+
+        # One scan finds every acronym; the output is assembled from slices of
+        # the input and joined once
+        pieces = []
+        position = 0
+        for match in self._find_acronyms(text):
+            acronym = match.group()
+            if acronym in skipped:
                 continue
 
             # Track frequency
-            if acronym not in self.usage_frequency:
-                self.usage_frequency[acronym] = 0
-            self.usage_frequency[acronym] += len(matches)
-
-            # Get the primary expansion (first in list)
-            expansion = expansions[0]
-
-            # Expand based on format style
-            if format_style == "parenthetical":
-                replacement = f"{acronym} ({expansion})"
-            elif format_style == "replacement":
-                replacement = expansion
-            elif format_style == "footnote":
-                replacement = f"{acronym} [^{acronym}]"
-            else:
-                replacement = f"{acronym} ({expansion})"
+            self.usage_frequency[acronym] = self.usage_frequency.get(acronym, 0) + 1
 
             # Replace first occurrence or all
-            if self.first_occurrence_only or not self.expand_all:
-                # Replace only first occurrence
-                match = matches[0]
-                result = result[:match.start()] + replacement + result[match.end():]
-                self.expanded_acronyms.add(acronym)
-            else:
-                # Replace all occurrences
-                result = re.sub(pattern, replacement, result)
-
-        return result
+            if first_only:
+                if acronym in replaced:
+                    continue
+                replaced.add(acronym)
+
+            # Expand with the primary expansion (first in list)
+            pieces.append(text[position:match.start()])
+            pieces.append(self._format_expansion(acronym, self.acronym_db[acronym][0], format_style))
+            position = match.end()
+
+        if first_only:
+            self.expanded_acronyms.update(replaced)
+
+        if not pieces:
+            return text
+        pieces.append(text[position:])
+        return "".join(pieces)
+
+    @staticmethod
+    def _format_expansion(acronym: str, expansion: str, format_style: str) -> str:
+        """Format one expanded acronym in the given style (see ``expand_text``)."""
+        if format_style == "replacement":
+            return expansion
+        if format_style == "footnote":
+            return f"{acronym} [^{acronym}]"
+        return f"{acronym} ({expansion})"
 
     def identify_acronyms(self, text: str) -> List[Tuple[str, str, int]]:
         """
@@ -324,21 +363,11 @@ class AcronymExpander:
         Returns:
             List of tuples (acronym, expansion, position)
         """
-        found_acronyms = []
-
-        for acronym, expansions in self.acronym_db.items():
-            pattern = r'\b' + re.escape(acronym) + r'\b'
-            for match in re.finditer(pattern, text):
-                found_acronyms.append((
-                    acronym,
-                    expansions[0],
-                    match.start()
-                ))
-
-        # Sort by position
-        found_acronyms.sort(key=lambda x: x[2])
-
-        return found_acronyms
+        # One scan over the text finds every acronym, already in position order
+        return [
+            (match.group(), self.acronym_db[match.group()][0], match.start())
+            for match in self._find_acronyms(text)
+        ]
 
     def get_expansion(self, acronym: str) -> Optional[str]:
         """
@@ -350,7 +379,10 @@ class AcronymExpander:
         Returns:
             Expansion string or None if not found
         """
-        expansions = self.acronym_db.get(acronym.upper())
+        expansions = self.acronym_db.get(acronym)
+        if expansions is None:
+            key = self._upper_index.get(acronym.upper())
+            expansions = self.acronym_db[key] if key else None
         return expansions[0] if expansions else None
 
     def add_acronym(self, acronym: str, expansion: str, alternatives: Optional[List[str]] = None):
@@ -366,12 +398,44 @@ class AcronymExpander:
         if alternatives:
             expansions.extend(alternatives)
 
-        self.acronym_db[acronym.upper()] = expansions
+        acronym = acronym.upper()
+        self.acronym_db[acronym] = expansions
+        self._upper_index[acronym] = acronym
+        self._compound_acronyms = None
+
+    def _find_acronyms(self, text: str) -> Iterator[re.Match]:
+        """
+        Find whole-word acronym occurrences in text, in position order.
+
+        The text's words are collected first, and only acronyms that can
+        occur in it go into the pattern, so text mentioning few acronyms
+        is scanned with a small alternation instead of the whole database.
+        """
+        if self._compound_acronyms is None:
+            self._compound_acronyms = {
+                acronym: frozenset(_WORD_PATTERN.findall(acronym))
+                for acronym in self.acronym_db
+                if not _WORD_PATTERN.fullmatch(acronym)
+            }
+
+        words = set(_WORD_PATTERN.findall(text))
+        present = words.intersection(self.acronym_db)
+        present.update(
+            acronym for acronym, parts in self._compound_acronyms.items() if words.issuperset(parts)
+        )
+        if not present:
+            return iter(())
+        return _build_acronym_pattern(frozenset(present)).finditer(text)
 
     def reset_expanded(self):
         """Reset tracking of expanded acronyms."""
         self.expanded_acronyms.clear()
 
+    def reset(self):
+        """Reset all per-text state: expanded acronyms and usage statistics."""
+        self.reset_expanded()
+        self.usage_frequency.clear()
+
     def get_usage_statistics(self) -> Dict[str, int]:
         """
         Get usage frequency statistics for acronyms.
@@ -470,75 +534,60 @@ class IntelligentAcronymExpander(AcronymExpander):
             # Fall back to basic expansion
             return super().expand_text(text, format_style)
 
-        result = text
-        offset = 0  # Track position offset from replacements
-
-        for acronym, expansions in self.acronym_db.items():
-            # Skip if already expanded
-            if self.first_occurrence_only and acronym in self.expanded_acronyms:
-                continue
-
-            # Find all occurrences
-            pattern = r'\b' + re.escape(acronym) + r'\b'
-            matches = list(re.finditer(pattern, text))
-
-            if not matches:
+        # Acronyms expanded by an earlier call are neither expanded nor counted again
+        skipped = set(self.expanded_acronyms) if self.first_occurrence_only else set()
+        first_only = self.first_occurrence_only or not self.expand_all
+        replaced = set()
+
+        # Collect replacements in a single scan of the input and join once,
+        # so match positions always refer to the original text
+        pieces = []
+        position = 0
+        for match in self._find_acronyms(text):
+            acronym = match.group()
+            if acronym in skipped:
                 continue
 
             # Track frequency
-            if acronym not in self.usage_frequency:
-                self.usage_frequency[acronym] = 0
-            self.usage_frequency[acronym] += len(matches)
+            self.usage_frequency[acronym] = self.usage_frequency.get(acronym, 0) + 1
 
             # Process first match (or all if expand_all)
-            matches_to_process = matches if self.expand_all else [matches[0]]
-
-            for match in matches_to_process:
-                # Get expansion - use context matching if multiple meanings
-                if len(expansions) > 1:
-                    # Try context-aware disambiguation
-                    expansion = self.context_matcher.match_with_context(
-                        text,
-                        acronym,
-                        match.start()
-                    )
-
-                    if expansion:
-                        # Track successful disambiguation
-                        if acronym not in self.disambiguation_history:
-                            self.disambiguation_history[acronym] = {}
-                        if expansion not in self.disambiguation_history[acronym]:
-                            self.disambiguation_history[acronym][expansion] = 0
-                        self.disambiguation_history[acronym][expansion] += 1
-                    else:
-                        # Fall back to first expansion
-                        expansion = expansions[0]
-                else:
-                    expansion = expansions[0]
+            if first_only:
+                if acronym in replaced:
+                    continue
+                replaced.add(acronym)
+
+            # Get expansion - use context matching if multiple meanings
+            expansions = self.acronym_db[acronym]
+            if len(expansions) > 1:
+                # Try context-aware disambiguation
+                expansion = self.context_matcher.match_with_context(
+                    text,
+                    acronym,
+                    match.start()
+                )
 
-                # Format expansion
-                if format_style == "parenthetical":
-                    replacement = f"{acronym} ({expansion})"
-                elif format_style == "replacement":
-                    replacement = expansion
-                elif format_style == "footnote":
-                    replacement = f"{acronym} [^{acronym}]"
+                if expansion:
+                    # Track successful disambiguation
+                    history = self.disambiguation_history.setdefault(acronym, {})
+                    history[expansion] = history.get(expansion, 0) + 1
                 else:
-                    replacement = f"{acronym} ({expansion})"
-
-                # Apply replacement with offset
-                start_pos = match.start() + offset
-                end_pos = match.end() + offset
-                result = result[:start_pos] + replacement + result[end_pos:]
+                    # Fall back to first expansion
+                    expansion = expansions[0]
+            else:
+                expansion = expansions[0]
 
-                # Update offset
-                offset += len(replacement) - len(acronym)
+            pieces.append(text[position:match.start()])
+            pieces.append(self._format_expansion(acronym, expansion, format_style))
+            position = match.end()
 
-                if self.first_occurrence_only:
-                    self.expanded_acronyms.add(acronym)
-                    break
+        if self.first_occurrence_only:
+            self.expanded_acronyms.update(replaced)
 
-        return result
+        if not pieces:
+            return text
+        pieces.append(text[position:])
+        return "".join(pieces)
 
     def get_disambiguation_statistics(self) -> Dict[str, Dict[str, int]]:
         """
@@ -549,6 +598,17 @@ class IntelligentAcronymExpander(AcronymExpander):
         """
         return self.disambiguation_history.copy()
 
+    def reset(self):
+        """Reset all per-text state, including disambiguation statistics."""
+        super().reset()
+        self.disambiguation_history.clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_glossary_expander() -> AcronymExpander:
+    """Default-database expander shared by glossary calls (identify_acronyms keeps no state)."""
+    return AcronymExpander()
+
 
 def create_acronym_glossary(text: str) -> str:
     """
@@ -560,22 +620,15 @@ def create_acronym_glossary(text: str) -> str:
     Returns:
         Formatted glossary string
     """
-    expander = AcronymExpander()
-    acronyms = expander.identify_acronyms(text)
+    acronyms = _get_glossary_expander().identify_acronyms(text)
 
     if not acronyms:
         return ""
 
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_acronyms = []
-    for acr, exp, _ in acronyms:
-        if acr not in seen:
-            unique_acronyms.append((acr, exp))
-            seen.add(acr)
+    # Remove duplicates; each acronym always has the same primary expansion
+    unique_acronyms = dict.fromkeys((acr, exp) for acr, exp, _ in acronyms)
 
     glossary_lines = ["## Acronym Glossary\n"]
-    for acr, exp in sorted(unique_acronyms):
-        glossary_lines.append(f"- **{acr}**: {exp}")
+    glossary_lines.extend(f"- **{acr}**: {exp}" for acr, exp in sorted(unique_acronyms))
 
     return "\n".join(glossary_lines)
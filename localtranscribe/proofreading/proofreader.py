@@ -4,6 +4,7 @@ Main proofreader class for applying transcription corrections.
 
 import re
 import json
+import threading
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, field
@@ -264,6 +265,74 @@ class Proofreader:
                 if self.verbose:
                     print(f"Warning: Invalid regex pattern '{pattern}': {e}")
 
+        # Cleanup and capitalization patterns are fixed per rule set too
+        self.compiled_repetition_rules = []
+        repetition_cleanup = self.rules.get("repetition_cleanup", {})
+        for rule in repetition_cleanup.get("patterns", []) if repetition_cleanup.get("enabled") else []:
+            pattern = rule.get("pattern", "")
+            if not pattern:
+                continue
+
+            try:
+                self.compiled_repetition_rules.append((
+                    re.compile(pattern, re.IGNORECASE),
+                    rule.get("replacement", ""),
+                    rule.get("description", "Repetition cleanup"),
+                ))
+            except re.error as e:
+                if self.verbose:
+                    print(f"Warning: Invalid regex pattern '{pattern}': {e}")
+
+        self.compiled_capitalization_rules = []
+        capitalization = self.rules.get("capitalization", {})
+        for rule in capitalization.get("rules", []) if capitalization.get("enabled") else []:
+            pattern = rule.get("pattern", "")
+            if not pattern:
+                continue
+
+            try:
+                self.compiled_capitalization_rules.append((re.compile(pattern), rule.get("replacement")))
+            except re.error as e:
+                if self.verbose:
+                    print(f"Warning: Invalid regex pattern '{pattern}': {e}")
+
+    def _apply_rule(
+        self,
+        pattern: re.Pattern,
+        replacement: str,
+        description: str,
+        text: str,
+        changes: List[ProofreadingChange],
+    ) -> Tuple[str, bool]:
+        """
+        Apply one replacement rule in a single scan, recording changes if tracked.
+
+        Returns:
+            Tuple of (new text, whether the text changed)
+        """
+        if self.track_changes:
+            rule_changes = []
+
+            def substitute(match: re.Match) -> str:
+                original_text = match.group(0)
+                new_text = pattern.sub(replacement, original_text)
+                if original_text != new_text:
+                    rule_changes.append(ProofreadingChange(
+                        original=original_text,
+                        replacement=new_text,
+                        position=match.start(),
+                        rule_description=description
+                    ))
+                return match.expand(replacement)
+
+            new_text, count = pattern.subn(substitute, text)
+            # Changes are reported last match first
+            changes.extend(reversed(rule_changes))
+        else:
+            new_text, count = pattern.subn(replacement, text)
+
+        return new_text, count > 0 and new_text != text
+
     def _load_domain_dictionaries(self) -> None:
         """Load and compile domain-specific dictionaries."""
         from .domain_dictionaries import get_domain_dictionary
@@ -355,30 +424,11 @@ class Proofreader:
 
                 for domain, patterns in self.domain_patterns.items():
                     for rule in patterns:
-                        pattern = rule["pattern"]
-                        replacement = rule["replacement"]
-                        description = rule["description"]
-
-                        # Track changes if enabled
-                        if self.track_changes:
-                            matches = list(pattern.finditer(corrected))
-                            for match in reversed(matches):
-                                original_text = match.group(0)
-                                new_text = pattern.sub(replacement, original_text)
-
-                                if original_text != new_text:
-                                    changes.append(ProofreadingChange(
-                                        original=original_text,
-                                        replacement=new_text,
-                                        position=match.start(),
-                                        rule_description=description
-                                    ))
-
-                        # Apply the replacement
-                        new_corrected = pattern.sub(replacement, corrected)
-                        if new_corrected != corrected:
+                        corrected, applied = self._apply_rule(
+                            rule["pattern"], rule["replacement"], rule["description"], corrected, changes
+                        )
+                        if applied:
                             result.rules_applied += 1
-                            corrected = new_corrected
 
             # Apply main replacement rules
             if self.verbose:
@@ -389,42 +439,20 @@ class Proofreader:
                 if rule.get("preserve"):
                     continue
 
-                pattern = rule["pattern"]
-                replacement = rule["replacement"]
-                description = rule["description"]
-
-                # Track changes if enabled
-                if self.track_changes:
-                    matches = list(pattern.finditer(corrected))
-                    for match in reversed(matches):  # Process in reverse to maintain positions
-                        original_text = match.group(0)
-                        new_text = pattern.sub(replacement, original_text)
-
-                        if original_text != new_text:
-                            changes.append(ProofreadingChange(
-                                original=original_text,
-                                replacement=new_text,
-                                position=match.start(),
-                                rule_description=description
-                            ))
-
-                # Apply the replacement
-                new_corrected = pattern.sub(replacement, corrected)
-                if new_corrected != corrected:
+                corrected, applied = self._apply_rule(
+                    rule["pattern"], rule["replacement"], rule["description"], corrected, changes
+                )
+                if applied:
                     result.rules_applied += 1
-                    corrected = new_corrected
 
             # Apply repetition cleanup
             if apply_repetition_cleanup and self.rules.get("repetition_cleanup", {}).get("enabled"):
                 if self.verbose:
                     print("Cleaning up repetitions...")
 
-                for pattern_rule in self.rules["repetition_cleanup"].get("patterns", []):
-                    pattern = re.compile(pattern_rule["pattern"], re.IGNORECASE)
-                    replacement = pattern_rule["replacement"]
-
-                    new_corrected = pattern.sub(replacement, corrected)
-                    if new_corrected != corrected:
+                for pattern, replacement, description in self.compiled_repetition_rules:
+                    new_corrected, count = pattern.subn(replacement, corrected)
+                    if count and new_corrected != corrected:
                         result.rules_applied += 1
                         corrected = new_corrected
 
@@ -433,7 +461,7 @@ class Proofreader:
                                 original="[repetition]",
                                 replacement="[cleaned]",
                                 position=-1,
-                                rule_description=pattern_rule.get("description", "Repetition cleanup")
+                                rule_description=description
                             ))
 
             # Apply capitalization fixes
@@ -441,17 +469,10 @@ class Proofreader:
                 if self.verbose:
                     print("Fixing capitalization...")
 
-                for cap_rule in self.rules["capitalization"].get("rules", []):
-                    pattern = re.compile(cap_rule["pattern"])
-                    replacement = cap_rule.get("replacement")
-
-                    if callable(replacement):
-                        # Lambda replacement
-                        new_corrected = pattern.sub(replacement, corrected)
-                    else:
-                        new_corrected = pattern.sub(replacement, corrected)
-
-                    if new_corrected != corrected:
+                for pattern, replacement in self.compiled_capitalization_rules:
+                    # Replacement may be a string or a function of the match
+                    new_corrected, count = pattern.subn(replacement, corrected)
+                    if count and new_corrected != corrected:
                         result.rules_applied += 1
                         corrected = new_corrected
 
@@ -606,4 +627,43 @@ class Proofreader:
         except ValueError:
             level_enum = ProofreadingLevel.STANDARD
 
-        return cls(level=level_enum, **kwargs)
\ No newline at end of file
+        return cls(level=level_enum, **kwargs)
+
+
+# Proofreaders kept for reuse, one set per thread: building one compiles every
+# rule and dictionary pattern, and the acronym expander carries per-text state
+_PROOFREADER_CACHE = threading.local()
+
+
+def get_cached_proofreader(rules_path: Optional[Path] = None, **kwargs) -> Proofreader:
+    """
+    Get a Proofreader for these settings, reusing one built earlier in this thread.
+
+    Args:
+        rules_path: Optional custom rules file; editing it invalidates the cached proofreader
+        **kwargs: Arguments for Proofreader
+
+    Returns:
+        Proofreader ready for a new text
+    """
+    rules_mtime = rules_path.stat().st_mtime if rules_path else None
+    settings = tuple(
+        sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in kwargs.items())
+    )
+    key = (rules_path, rules_mtime, settings)
+
+    cache = getattr(_PROOFREADER_CACHE, "proofreaders", None)
+    if cache is None:
+        cache = _PROOFREADER_CACHE.proofreaders = {}
+
+    proofreader = cache.get(key)
+    if proofreader is None:
+        proofreader = Proofreader(**kwargs)
+        if rules_path:
+            proofreader.load_rules_from_file(rules_path)
+        cache[key] = proofreader
+    elif proofreader.acronym_expander is not None:
+        # Expansion tracking and usage statistics start over for each text
+        proofreader.acronym_expander.reset()
+
+    return proofreader
@@ -6,6 +6,7 @@ thinking the application is frozen during first-run downloads.
 """
 
 import os
+import threading
 from pathlib import Path
 from typing import Optional, Callable
 from contextlib import contextmanager
@@ -16,6 +17,17 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, DownloadColumn, T
 console = Console()
 
 
+def progress_display_enabled() -> bool:
+    """
+    Whether spinners and progress bars may be drawn from the calling thread.
+
+    Rich allows one live display per console, and concurrent progress bars
+    garble the terminal, so only the main thread draws them. Pipeline stages
+    running in worker threads print plain status lines instead.
+    """
+    return threading.current_thread() is threading.main_thread()
+
+
 def get_cache_dir() -> Path:
     """
     Get the cache directory for models.
@@ -80,7 +92,7 @@ def download_status(description: str, show_spinner: bool = True):
         with download_status("Downloading diarization model..."):
             pipeline = Pipeline.from_pretrained(model_name, token=token)
     """
-    if show_spinner:
+    if show_spinner and progress_display_enabled():
         with console.status(f"[bold cyan]{description}[/bold cyan]") as status:
             yield status
     else:
@@ -264,9 +276,13 @@ def loading_spinner(message: str, complete_message: Optional[str] = None):
         with loading_spinner("Loading model...", "Model loaded!"):
             model = load_model()
     """
-    with console.status(f"[bold cyan]{message}[/bold cyan]") as status:
-        yield status
-    
+    if progress_display_enabled():
+        with console.status(f"[bold cyan]{message}[/bold cyan]") as status:
+            yield status
+    else:
+        console.print(f"[cyan]{message}[/cyan]")
+        yield None
+
     if complete_message:
         console.print(f"[green]✓[/green] {complete_message}")
 
@@ -0,0 +1,92 @@
+"""Tests for diarization segment post-processing.
+
+Every case runs through both implementations of the pipeline: the NumPy
+passes and the compiled kernel (plain Python when numba is not installed).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from localtranscribe.core import segment_processing
+from localtranscribe.core.diarization import DiarizationResult
+from localtranscribe.core.segment_processing import SegmentProcessingConfig, SegmentProcessor
+
+
+@pytest.fixture(params=[False, True], ids=["numpy", "kernel"])
+def use_kernel(request, monkeypatch):
+    """Select the segment pipeline implementation for the test."""
+    monkeypatch.setattr(segment_processing, "SEGMENT_KERNEL_AVAILABLE", request.param)
+    return request.param
+
+
+def _process(spans, **config):
+    """Process (speaker, start, end) spans and return the spans and stats after processing."""
+    segments = [
+        {"speaker": speaker, "start": start, "end": end, "duration": end - start}
+        for speaker, start, end in spans
+    ]
+    result = DiarizationResult(
+        success=True,
+        audio_file=Path("audio.wav"),
+        processing_time=0.0,
+        num_speakers=len({speaker for speaker, _, _ in spans}),
+        segments=segments,
+    )
+    result = SegmentProcessor(SegmentProcessingConfig(**config)).process(result)
+    processed = [(seg["speaker"], seg["start"], seg["end"]) for seg in result.segments]
+    return processed, result.metadata["segment_processing"]["stats"]
+
+
+def test_short_segment_between_same_speaker_is_smoothed(use_kernel):
+    spans, stats = _process([("A", 0.0, 4.0), ("B", 4.2, 5.0), ("A", 5.5, 9.0)])
+
+    assert spans == [("A", 0.0, 9.0)]
+    assert stats["smoothed_segment_count"] == 1
+    assert stats["final_segment_count"] == 1
+
+
+def test_smoothing_alternating_run_reassigns_every_other_segment(use_kernel):
+    # Reassigning B at 5s makes A at 6s follow an A, so only 1st and 3rd change
+    spans, stats = _process(
+        [("A", 0.0, 5.0), ("B", 5.0, 6.0), ("A", 6.0, 7.0), ("B", 7.0, 8.0), ("A", 8.0, 13.0)]
+    )
+
+    assert spans == [("A", 0.0, 13.0)]
+    assert stats["smoothed_segment_count"] == 2
+
+
+def test_long_segment_between_same_speaker_is_kept(use_kernel):
+    spans, stats = _process([("A", 0.0, 4.0), ("B", 4.0, 7.0), ("A", 7.0, 9.0)])
+
+    assert spans == [("A", 0.0, 4.0), ("B", 4.0, 7.0), ("A", 7.0, 9.0)]
+    assert stats["smoothed_segment_count"] == 0
+
+
+def test_merge_counts_only_segments_within_gap_threshold(use_kernel):
+    # Smoothing joins the remaining same-speaker neighbours regardless of gap
+    spans, stats = _process(
+        [("A", 0.0, 3.0), ("A", 3.5, 6.0), ("A", 8.0, 10.0), ("B", 10.0, 13.0)]
+    )
+
+    assert spans == [("A", 0.0, 10.0), ("B", 10.0, 13.0)]
+    assert stats["merged_segment_count"] == 1
+
+
+def test_micro_segments_are_filtered(use_kernel):
+    spans, stats = _process([("A", 0.0, 3.0), ("B", 3.0, 3.1), ("C", 3.2, 6.0)])
+
+    assert spans == [("A", 0.0, 3.0), ("C", 3.2, 6.0)]
+    assert stats["micro_segments_removed"] == 1
+
+
+@pytest.mark.parametrize("min_segment_duration", [0.0, -1.0])
+def test_non_positive_min_segment_duration_disables_filtering(use_kernel, min_segment_duration):
+    spans, stats = _process(
+        [("A", 0.0, 3.0), ("B", 3.0, 3.0), ("C", 3.2, 6.0)],
+        min_segment_duration=min_segment_duration,
+    )
+
+    assert spans == [("A", 0.0, 3.0), ("B", 3.0, 3.0), ("C", 3.2, 6.0)]
+    assert stats["micro_segments_removed"] == 0
+    assert stats["final_segment_count"] == 3